@@ -79,7 +79,11 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            # Commit after each revision so catalog locks are released
+            # between migrations instead of held for the whole upgrade.
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,62 @@
+"""Add foreign key indexes
+
+Revision ID: 0b0e8b4dd15f
+Revises: eb82e63c95fa
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b0e8b4dd15f'
+down_revision: Union[str, None] = 'eb82e63c95fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_compliance_tasks_organization_id'), 'compliance_tasks', ['organization_id'], unique=False)
+    op.create_index(op.f('ix_compliance_tasks_jurisdiction_id'), 'compliance_tasks', ['jurisdiction_id'], unique=False)
+    op.create_index(op.f('ix_compliance_tasks_assignee_id'), 'compliance_tasks', ['assignee_id'], unique=False)
+    op.create_index('ix_compliance_tasks_org_status', 'compliance_tasks', ['organization_id', 'status'], unique=False)
+    op.create_index(op.f('ix_compliance_reports_organization_id'), 'compliance_reports', ['organization_id'], unique=False)
+    op.create_index(op.f('ix_compliance_documents_jurisdiction_id'), 'compliance_documents', ['jurisdiction_id'], unique=False)
+    op.create_index(op.f('ix_compliance_requirements_jurisdiction_id'), 'compliance_requirements', ['jurisdiction_id'], unique=False)
+    op.create_index(op.f('ix_assessment_sessions_organization_id'), 'assessment_sessions', ['organization_id'], unique=False)
+    op.create_index(op.f('ix_compliance_assessments_session_id'), 'compliance_assessments', ['session_id'], unique=False)
+    op.create_index(op.f('ix_compliance_assessments_organization_id'), 'compliance_assessments', ['organization_id'], unique=False)
+    op.create_index(op.f('ix_compliance_assessments_requirement_id'), 'compliance_assessments', ['requirement_id'], unique=False)
+    op.create_index(op.f('ix_documents_organization_id'), 'documents', ['organization_id'], unique=False)
+    op.create_index(op.f('ix_document_analyses_document_id'), 'document_analyses', ['document_id'], unique=False)
+    op.create_index(op.f('ix_form_responses_user_id'), 'form_responses', ['user_id'], unique=False)
+    op.create_index(op.f('ix_form_responses_question_id'), 'form_responses', ['question_id'], unique=False)
+    op.create_index('ix_form_responses_org_user', 'form_responses', ['organization_id', 'user_id'], unique=False)
+    op.create_index(op.f('ix_organization_jurisdictions_organization_id'), 'organization_jurisdictions', ['organization_id'], unique=False)
+    op.create_index(op.f('ix_organization_jurisdictions_jurisdiction_id'), 'organization_jurisdictions', ['jurisdiction_id'], unique=False)
+    op.create_index(op.f('ix_user_organizations_organization_id'), 'user_organizations', ['organization_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_user_organizations_organization_id'), table_name='user_organizations')
+    op.drop_index(op.f('ix_organization_jurisdictions_jurisdiction_id'), table_name='organization_jurisdictions')
+    op.drop_index(op.f('ix_organization_jurisdictions_organization_id'), table_name='organization_jurisdictions')
+    op.drop_index('ix_form_responses_org_user', table_name='form_responses')
+    op.drop_index(op.f('ix_form_responses_question_id'), table_name='form_responses')
+    op.drop_index(op.f('ix_form_responses_user_id'), table_name='form_responses')
+    op.drop_index(op.f('ix_document_analyses_document_id'), table_name='document_analyses')
+    op.drop_index(op.f('ix_documents_organization_id'), table_name='documents')
+    op.drop_index(op.f('ix_compliance_assessments_requirement_id'), table_name='compliance_assessments')
+    op.drop_index(op.f('ix_compliance_assessments_organization_id'), table_name='compliance_assessments')
+    op.drop_index(op.f('ix_compliance_assessments_session_id'), table_name='compliance_assessments')
+    op.drop_index(op.f('ix_assessment_sessions_organization_id'), table_name='assessment_sessions')
+    op.drop_index(op.f('ix_compliance_requirements_jurisdiction_id'), table_name='compliance_requirements')
+    op.drop_index(op.f('ix_compliance_documents_jurisdiction_id'), table_name='compliance_documents')
+    op.drop_index(op.f('ix_compliance_reports_organization_id'), table_name='compliance_reports')
+    op.drop_index('ix_compliance_tasks_org_status', table_name='compliance_tasks')
+    op.drop_index(op.f('ix_compliance_tasks_assignee_id'), table_name='compliance_tasks')
+    op.drop_index(op.f('ix_compliance_tasks_jurisdiction_id'), table_name='compliance_tasks')
+    op.drop_index(op.f('ix_compliance_tasks_organization_id'), table_name='compliance_tasks')
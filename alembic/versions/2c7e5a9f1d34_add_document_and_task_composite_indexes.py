@@ -0,0 +1,42 @@
+"""Add document and task composite indexes
+
+Revision ID: 2c7e5a9f1d34
+Revises: 6a1f3d8c2e57
+Create Date: 2026-10-16 17:21:44.906113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c7e5a9f1d34'
+down_revision: Union[str, None] = '6a1f3d8c2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Documents are listed per organization, newest first; superset of the
+    # organization_id index
+    op.create_index('ix_documents_org_upload_date', 'documents', ['organization_id', sa.text('upload_date DESC')], unique=False)
+    op.drop_index('ix_documents_organization_id', table_name='documents')
+    # Existing-requirement lookups during extraction; superset of the
+    # jurisdiction_id index
+    op.create_index('ix_compliance_requirements_jurisdiction_requirement', 'compliance_requirements', ['jurisdiction_id', 'requirement_id'], unique=False)
+    op.drop_index('ix_compliance_requirements_jurisdiction_id', table_name='compliance_requirements')
+    # Task filters by organization and jurisdiction; the organization_id
+    # prefix is already served by ix_compliance_tasks_org_status
+    op.create_index('ix_compliance_tasks_org_jurisdiction', 'compliance_tasks', ['organization_id', 'jurisdiction_id'], unique=False)
+    op.drop_index('ix_compliance_tasks_organization_id', table_name='compliance_tasks')
+
+
+def downgrade() -> None:
+    op.create_index('ix_compliance_tasks_organization_id', 'compliance_tasks', ['organization_id'], unique=False)
+    op.drop_index('ix_compliance_tasks_org_jurisdiction', table_name='compliance_tasks')
+    op.create_index('ix_compliance_requirements_jurisdiction_id', 'compliance_requirements', ['jurisdiction_id'], unique=False)
+    op.drop_index('ix_compliance_requirements_jurisdiction_requirement', table_name='compliance_requirements')
+    op.create_index('ix_documents_organization_id', 'documents', ['organization_id'], unique=False)
+    op.drop_index('ix_documents_org_upload_date', table_name='documents')
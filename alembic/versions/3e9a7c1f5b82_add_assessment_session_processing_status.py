@@ -0,0 +1,28 @@
+"""Add assessment session processing status
+
+Revision ID: 3e9a7c1f5b82
+Revises: c41e7b9d2a6f
+Create Date: 2026-10-16 15:02:37.418263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9a7c1f5b82'
+down_revision: Union[str, None] = 'c41e7b9d2a6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Document assessments now run in the background; existing sessions
+    # were all assessed inline, so they start out 'completed'
+    op.add_column('assessment_sessions', sa.Column('processing_status', sa.String(length=20), server_default='completed', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('assessment_sessions', 'processing_status')
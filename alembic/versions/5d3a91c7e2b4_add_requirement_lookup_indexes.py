@@ -0,0 +1,33 @@
+"""Add requirement lookup indexes
+
+Revision ID: 5d3a91c7e2b4
+Revises: 0b0e8b4dd15f
+Create Date: 2026-10-16 10:02:17.540921
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3a91c7e2b4'
+down_revision: Union[str, None] = '0b0e8b4dd15f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves both the per-document requirement counts and the
+    # requirement_id-ordered listing of a document's requirements
+    op.create_index('ix_compliance_requirements_source_document_requirement', 'compliance_requirements', ['source_document_id', 'requirement_id'], unique=False)
+    # Superset of the single-column organization_id index
+    op.create_index('ix_compliance_assessments_org_requirement', 'compliance_assessments', ['organization_id', 'requirement_id'], unique=False)
+    op.drop_index('ix_compliance_assessments_organization_id', table_name='compliance_assessments')
+
+
+def downgrade() -> None:
+    op.create_index('ix_compliance_assessments_organization_id', 'compliance_assessments', ['organization_id'], unique=False)
+    op.drop_index('ix_compliance_assessments_org_requirement', table_name='compliance_assessments')
+    op.drop_index('ix_compliance_requirements_source_document_requirement', table_name='compliance_requirements')
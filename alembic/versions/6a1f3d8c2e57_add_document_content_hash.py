@@ -0,0 +1,28 @@
+"""Add document content hash
+
+Revision ID: 6a1f3d8c2e57
+Revises: 9b6d2f4e8a13
+Create Date: 2026-10-16 16:48:05.271936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a1f3d8c2e57'
+down_revision: Union[str, None] = '9b6d2f4e8a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_documents_content_hash'), 'documents', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_documents_content_hash'), table_name='documents')
+    op.drop_column('documents', 'content_hash')
@@ -0,0 +1,28 @@
+"""Add document file size and mime type
+
+Revision ID: 7d4b2e9a6c15
+Revises: 2c7e5a9f1d34
+Create Date: 2026-10-16 18:05:37.214580
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4b2e9a6c15'
+down_revision: Union[str, None] = '2c7e5a9f1d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('file_size', sa.Integer(), nullable=True))
+    op.add_column('documents', sa.Column('mime_type', sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'mime_type')
+    op.drop_column('documents', 'file_size')
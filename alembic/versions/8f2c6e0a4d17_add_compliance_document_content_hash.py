@@ -0,0 +1,28 @@
+"""Add compliance document content hash
+
+Revision ID: 8f2c6e0a4d17
+Revises: 5d3a91c7e2b4
+Create Date: 2026-10-16 10:41:53.102764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c6e0a4d17'
+down_revision: Union[str, None] = '5d3a91c7e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('compliance_documents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_compliance_documents_content_hash'), 'compliance_documents', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_compliance_documents_content_hash'), table_name='compliance_documents')
+    op.drop_column('compliance_documents', 'content_hash')
@@ -0,0 +1,30 @@
+"""Add assessment session organization created index
+
+Revision ID: 9b6d2f4e8a13
+Revises: 3e9a7c1f5b82
+Create Date: 2026-10-16 15:40:12.583904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b6d2f4e8a13'
+down_revision: Union[str, None] = '3e9a7c1f5b82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sessions are listed per organization, newest first, a page at a time;
+    # superset of the organization_id index
+    op.create_index('ix_assessment_sessions_org_created', 'assessment_sessions', ['organization_id', sa.text('created_at DESC')], unique=False)
+    op.drop_index('ix_assessment_sessions_organization_id', table_name='assessment_sessions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_assessment_sessions_organization_id', 'assessment_sessions', ['organization_id'], unique=False)
+    op.drop_index('ix_assessment_sessions_org_created', table_name='assessment_sessions')
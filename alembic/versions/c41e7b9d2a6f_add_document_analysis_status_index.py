@@ -0,0 +1,30 @@
+"""Add document analysis status index
+
+Revision ID: c41e7b9d2a6f
+Revises: 8f2c6e0a4d17
+Create Date: 2026-10-16 14:21:48.203117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7b9d2a6f'
+down_revision: Union[str, None] = '8f2c6e0a4d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Compliance endpoints join an organization's documents to their
+    # completed analyses, newest first; superset of the document_id index
+    op.create_index('ix_document_analyses_document_status_completed', 'document_analyses', ['document_id', 'status', sa.text('completed_at DESC')], unique=False)
+    op.drop_index('ix_document_analyses_document_id', table_name='document_analyses')
+
+
+def downgrade() -> None:
+    op.create_index('ix_document_analyses_document_id', 'document_analyses', ['document_id'], unique=False)
+    op.drop_index('ix_document_analyses_document_status_completed', table_name='document_analyses')
@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, insert, delete, func
+from sqlalchemy.orm import defer
 from app.database import get_db
 from app.api.deps import get_current_user, require_admin_role
 from app.models.user import User
-from app.models.jurisdiction import Jurisdiction
+from app.models.jurisdiction import Jurisdiction, RegulationType
 from app.models.compliance import ComplianceDocument, ComplianceRequirement
-from app.services.document_processor import document_processor
-from app.services.compliance_extractor import ComplianceExtractor
+from app.services.document_processor import document_processor, FileTooLargeError
+from app.services.compliance_extractor import compliance_extractor
 from app.config import settings
-from typing import List, Optional
-from uuid import UUID
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 import os
-import aiofiles
+import time
+import asyncio
 from datetime import datetime
 import logging
 
@@ -23,6 +26,40 @@ router = APIRouter()
 COMPLIANCE_DOCS_DIR = os.path.join(settings.UPLOAD_DIR, "compliance-docs")
 os.makedirs(COMPLIANCE_DOCS_DIR, exist_ok=True)
 
+# One directory per framework, created once at startup rather than per upload
+FRAMEWORK_DIRS = {
+    regulation_type.value: os.path.join(COMPLIANCE_DOCS_DIR, regulation_type.value)
+    for regulation_type in RegulationType
+}
+for framework_dir in FRAMEWORK_DIRS.values():
+    os.makedirs(framework_dir, exist_ok=True)
+
+# Extracted requirements are inserted and committed in batches of this size
+REQUIREMENTS_BATCH_SIZE = 500
+
+# Jurisdiction regulation types are effectively static, so uploads remember
+# them briefly instead of querying on every request
+JURISDICTION_CACHE_TTL = 60  # seconds
+_jurisdiction_type_cache: Dict[str, Tuple[float, str]] = {}
+
+
+async def get_jurisdiction_regulation_type(db: AsyncSession, jurisdiction_id: str) -> Optional[str]:
+    """Get a jurisdiction's regulation type value, or None if it doesn't exist"""
+    now = time.monotonic()
+    cached = _jurisdiction_type_cache.get(jurisdiction_id)
+    if cached and now - cached[0] < JURISDICTION_CACHE_TTL:
+        return cached[1]
+
+    result = await db.execute(
+        select(Jurisdiction.regulation_type).where(Jurisdiction.id == jurisdiction_id)
+    )
+    regulation_type = result.scalar_one_or_none()
+    if regulation_type is None:
+        return None
+
+    _jurisdiction_type_cache[jurisdiction_id] = (now, regulation_type.value)
+    return regulation_type.value
+
 
 @router.post("/compliance-documents/upload")
 async def upload_compliance_document(
@@ -46,35 +83,50 @@ async def upload_compliance_document(
         )
     
     # Validate jurisdiction exists
-    result = await db.execute(select(Jurisdiction).where(Jurisdiction.id == jurisdiction_id))
-    jurisdiction = result.scalar_one_or_none()
-    if not jurisdiction:
+    regulation_type = await get_jurisdiction_regulation_type(db, jurisdiction_id)
+    if not regulation_type:
         raise HTTPException(status_code=404, detail="Jurisdiction not found")
     
-    # Read and validate file
-    content = await file.read()
-    if len(content) > settings.MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail="File too large")
-    
-    # Create framework-specific directory
-    framework_dir = os.path.join(COMPLIANCE_DOCS_DIR, jurisdiction.regulation_type.value)
-    os.makedirs(framework_dir, exist_ok=True)
+    # Generate unique filename in the framework-specific directory
+    filename = f"{time.time_ns()}_{file.filename}"
+    file_path = os.path.join(FRAMEWORK_DIRS[regulation_type], filename)
     
-    # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{file.filename}"
-    file_path = os.path.join(framework_dir, filename)
+    # Stream file to disk, validating size as it arrives
+    try:
+        _, content_hash = await document_processor.save_upload_file(file, file_path, settings.MAX_FILE_SIZE)
+    except FileTooLargeError:
+        raise HTTPException(status_code=413, detail="File too large")
     
-    # Save file
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(content)
+    # Reuse an identical document already uploaded for this jurisdiction
+    # instead of storing it twice and re-running extraction
+    existing_result = await db.execute(
+        select(ComplianceDocument).where(
+            and_(
+                ComplianceDocument.jurisdiction_id == jurisdiction_id,
+                ComplianceDocument.content_hash == content_hash,
+                ComplianceDocument.processing_status != 'failed'
+            )
+        ).limit(1)
+    )
+    existing_doc = existing_result.scalar_one_or_none()
+    if existing_doc:
+        await document_processor.remove_file(file_path)
+        return {
+            "id": str(existing_doc.id),
+            "title": existing_doc.title,
+            "status": "duplicate",
+            "message": "An identical compliance document was already uploaded for this jurisdiction. The existing document was kept."
+        }
     
-    # Create database record
+    # Create database record; the id is assigned client-side so no flush
+    # round-trip is needed before the commit
     compliance_doc = ComplianceDocument(
+        id=uuid4(),
         jurisdiction_id=jurisdiction_id,
         title=title,
         document_type=document_type,
         file_path=file_path,
+        content_hash=content_hash,
         version=version,
         effective_date=datetime.fromisoformat(effective_date) if effective_date else None,
         uploaded_by=current_user.id,
@@ -82,18 +134,16 @@ async def upload_compliance_document(
     )
     
     db.add(compliance_doc)
-    await db.flush()
+    await db.commit()
     
-    # Queue background processing
+    # Queue background processing once the document is persisted
     background_tasks.add_task(
         process_compliance_document,
         str(compliance_doc.id),
         file_path,
-        jurisdiction.regulation_type.value
+        regulation_type
     )
 
-    await db.commit()
-
     return {
         "id": str(compliance_doc.id),
         "title": title,
@@ -103,7 +153,7 @@ async def upload_compliance_document(
     }
 
 
-@router.get("/compliance-documents")
+@router.get("/compliance-documents", response_class=ORJSONResponse)
 async def list_compliance_documents(
     jurisdiction_id: Optional[str] = None,
     current_user: User = Depends(require_admin_role),
@@ -111,65 +161,51 @@ async def list_compliance_documents(
 ):
     """List all compliance documents (Admin only)"""
 
-    # Query documents without relationships to avoid async issues
-    query = select(ComplianceDocument)
+    requirements_count = (
+        select(func.count(ComplianceRequirement.id))
+        .where(ComplianceRequirement.source_document_id == ComplianceDocument.id)
+        .scalar_subquery()
+    )
+
+    # Documents, their jurisdiction and requirement counts in a single query;
+    # the full extracted text isn't part of the listing, so don't load it
+    query = (
+        select(ComplianceDocument, Jurisdiction, requirements_count)
+        .outerjoin(Jurisdiction, ComplianceDocument.jurisdiction_id == Jurisdiction.id)
+        .options(
+            defer(ComplianceDocument.extracted_text),
+            defer(ComplianceDocument.extraction_metadata)
+        )
+    )
 
     if jurisdiction_id:
         query = query.where(ComplianceDocument.jurisdiction_id == jurisdiction_id)
 
     result = await db.execute(query)
-    documents = result.scalars().all()
-
-    # Get all jurisdiction IDs for a separate query
-    jurisdiction_ids = {doc.jurisdiction_id for doc in documents if doc.jurisdiction_id}
-
-    # Get jurisdictions in a separate query
-    jurisdictions_map = {}
-    if jurisdiction_ids:
-        from app.models.jurisdiction import Jurisdiction
-        jurisdiction_result = await db.execute(
-            select(Jurisdiction).where(Jurisdiction.id.in_(jurisdiction_ids))
-        )
-        jurisdictions = jurisdiction_result.scalars().all()
-        jurisdictions_map = {str(j.id): j for j in jurisdictions}
-
-    # Get requirements count for each document
-    requirements_count_map = {}
-    if documents:
-        doc_ids = [str(doc.id) for doc in documents]
-        from sqlalchemy import func
-        count_result = await db.execute(
-            select(
-                ComplianceRequirement.source_document_id,
-                func.count(ComplianceRequirement.id).label('count')
-            ).where(
-                ComplianceRequirement.source_document_id.in_(doc_ids)
-            ).group_by(ComplianceRequirement.source_document_id)
-        )
-        requirements_count_map = {str(row[0]): row[1] for row in count_result.all()}
 
-    return {
+    # orjson serializes UUIDs and datetimes natively, so values go out as-is
+    return ORJSONResponse({
         "documents": [
             {
-                "id": str(doc.id),
+                "id": doc.id,
                 "title": doc.title,
                 "document_type": doc.document_type,
                 "version": doc.version,
-                "effective_date": doc.effective_date.isoformat() if doc.effective_date else None,
-                "upload_date": doc.upload_date.isoformat(),
+                "effective_date": doc.effective_date,
+                "upload_date": doc.upload_date,
                 "is_processed": doc.is_processed,
                 "processing_status": doc.processing_status,
                 "jurisdiction": {
-                    "id": str(doc.jurisdiction_id),
-                    "name": jurisdictions_map[str(doc.jurisdiction_id)].name,
-                    "regulation_type": jurisdictions_map[str(doc.jurisdiction_id)].regulation_type.value
-                } if doc.jurisdiction_id and str(doc.jurisdiction_id) in jurisdictions_map else None,
-                "requirements_count": requirements_count_map.get(str(doc.id), 0),
-                "uploaded_by": str(doc.uploaded_by)
+                    "id": jurisdiction.id,
+                    "name": jurisdiction.name,
+                    "regulation_type": jurisdiction.regulation_type.value
+                } if jurisdiction else None,
+                "requirements_count": req_count,
+                "uploaded_by": doc.uploaded_by
             }
-            for doc in documents
+            for doc, jurisdiction, req_count in result
         ]
-    }
+    })
 
 
 @router.get("/compliance-documents/{document_id}/requirements")
@@ -208,6 +244,7 @@ async def get_document_requirements(
 @router.delete("/compliance-documents/{document_id}")
 async def delete_compliance_document(
     document_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_admin_role),
     db: AsyncSession = Depends(get_db)
 ):
@@ -221,14 +258,13 @@ async def delete_compliance_document(
     if not document:
         raise HTTPException(status_code=404, detail="Compliance document not found")
 
-    # Delete file
-    if os.path.exists(document.file_path):
-        os.remove(document.file_path)
-
     # Delete database record (requirements will be cascade deleted)
     await db.delete(document)
     await db.commit()
 
+    # Remove the file only once the record is gone, off the request path
+    background_tasks.add_task(document_processor.remove_file, document.file_path)
+
     return {"message": "Compliance document deleted successfully"}
 
 
@@ -239,10 +275,23 @@ async def list_assistants(
 ):
     """List all configured assistants for jurisdictions (Admin only)"""
 
+    # Count related rows in the same query instead of loading the collections
+    documents_count = (
+        select(func.count(ComplianceDocument.id))
+        .where(ComplianceDocument.jurisdiction_id == Jurisdiction.id)
+        .scalar_subquery()
+    )
+    requirements_count = (
+        select(func.count(ComplianceRequirement.id))
+        .where(ComplianceRequirement.jurisdiction_id == Jurisdiction.id)
+        .scalar_subquery()
+    )
+
     result = await db.execute(
-        select(Jurisdiction).where(Jurisdiction.assistant_id.isnot(None))
+        select(Jurisdiction, documents_count, requirements_count)
+        .where(Jurisdiction.assistant_id.isnot(None))
     )
-    jurisdictions_with_assistants = result.scalars().all()
+    jurisdictions_with_assistants = result.all()
 
     return {
         "assistants": [
@@ -253,10 +302,10 @@ async def list_assistants(
                 "assistant_id": jurisdiction.assistant_id,
                 "vector_store_id": jurisdiction.vector_store_id,
                 "created_at": jurisdiction.created_at.isoformat() if jurisdiction.created_at else None,
-                "compliance_documents_count": len(jurisdiction.compliance_documents) if hasattr(jurisdiction, 'compliance_documents') else 0,
-                "requirements_count": len(jurisdiction.requirements) if hasattr(jurisdiction, 'requirements') else 0
+                "compliance_documents_count": doc_count,
+                "requirements_count": req_count
             }
-            for jurisdiction in jurisdictions_with_assistants
+            for jurisdiction, doc_count, req_count in jurisdictions_with_assistants
         ],
         "total": len(jurisdictions_with_assistants)
     }
@@ -327,27 +376,32 @@ async def refresh_assistant(
     if not latest_document:
         raise HTTPException(status_code=400, detail="No compliance documents found for this jurisdiction")
 
-    # Delete old assistant if exists
+    # Delete old assistant if exists; the OpenAI cleanup is independent of
+    # building the new assistant, so let it run alongside the extraction
+    cleanup_task = None
     if jurisdiction.assistant_id:
         from app.services.assistant_manager import assistant_manager
-        try:
-            await assistant_manager.cleanup_assistant(
+        cleanup_task = asyncio.create_task(
+            assistant_manager.cleanup_assistant(
                 jurisdiction.assistant_id,
                 jurisdiction.vector_store_id
             )
-        except Exception as e:
-            logger.warning(f"Failed to cleanup old assistant: {e}")
-
-    # Create new assistant
-    from app.services.compliance_extractor import ComplianceExtractor
-    extractor = ComplianceExtractor()
+        )
 
-    _, extraction_metadata = await extractor.extract_requirements(
-        latest_document.file_path,
-        jurisdiction.regulation_type.value,
-        use_assistant_api=True,
-        keep_assistant=True
-    )
+    try:
+        # Create new assistant
+        _, extraction_metadata = await compliance_extractor.extract_requirements(
+            latest_document.file_path,
+            jurisdiction.regulation_type.value,
+            use_assistant_api=True,
+            keep_assistant=True
+        )
+    finally:
+        if cleanup_task:
+            try:
+                await cleanup_task
+            except Exception as e:
+                logger.warning(f"Failed to cleanup old assistant: {e}")
 
     # Update jurisdiction with new assistant
     jurisdiction.assistant_id = extraction_metadata.get('assistant_id')
@@ -377,8 +431,7 @@ async def process_compliance_document(document_id: str, file_path: str, framewor
             await db.commit()
 
             # Extract requirements using AI (keep_assistant=True for persistent storage)
-            extractor = ComplianceExtractor()
-            requirements, extraction_metadata = await extractor.extract_requirements(
+            requirements, extraction_metadata = await compliance_extractor.extract_requirements(
                 file_path, framework, use_assistant_api=True, keep_assistant=True
             )
 
@@ -415,20 +468,27 @@ async def process_compliance_document(document_id: str, file_path: str, framewor
 
                 await db.commit()
 
-            # Save extracted requirements to database
-            for req_data in requirements:
-                requirement = ComplianceRequirement(
-                    jurisdiction_id=document.jurisdiction_id,
-                    source_document_id=document.id,
-                    requirement_id=req_data["requirement_id"],
-                    title=req_data["title"],
-                    category=req_data["category"],
-                    description=req_data["description"],
-                    page_number=req_data.get("page_number"),
-                    section_reference=req_data.get("section_reference"),
-                    criticality=req_data["criticality"]
-                )
-                db.add(requirement)
+            # Save extracted requirements in bounded batches, committing each
+            # one so large documents don't build up a single huge transaction
+            rows = [
+                {
+                    "jurisdiction_id": document.jurisdiction_id,
+                    "source_document_id": document.id,
+                    "requirement_id": req_data["requirement_id"],
+                    "title": req_data["title"],
+                    "category": req_data["category"],
+                    "description": req_data["description"],
+                    "page_number": req_data.get("page_number"),
+                    "section_reference": req_data.get("section_reference"),
+                    "criticality": req_data["criticality"]
+                }
+                for req_data in requirements
+            ]
+            for start in range(0, len(rows), REQUIREMENTS_BATCH_SIZE):
+                batch = rows[start:start + REQUIREMENTS_BATCH_SIZE]
+                await db.execute(insert(ComplianceRequirement), batch)
+                await db.commit()
+                logger.info(f"Saved requirements {start + 1}-{start + len(batch)} of {len(rows)} for document {document_id}")
             
             # Update document status
             document.processing_status = 'completed'
@@ -439,6 +499,12 @@ async def process_compliance_document(document_id: str, file_path: str, framewor
             
         except Exception as e:
             logger.error(f"Failed to process compliance document {document_id}: {e}")
+            await db.rollback()
+            
+            # Remove any requirement batches already committed for this document
+            await db.execute(
+                delete(ComplianceRequirement).where(ComplianceRequirement.source_document_id == document_id)
+            )
             
             # Update status to failed
             result = await db.execute(
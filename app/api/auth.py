@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Response, Request, Query
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
@@ -6,10 +6,14 @@ from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.schemas.auth import Token, TokenRefresh, GoogleAuthRequest, GoogleAuthURL
 from app.core.auth import authenticate_user, create_user, get_user_by_email
 from app.core.security import create_token_response, decode_token
-from app.core.google_auth import google_auth
+from app.core.google_auth import google_auth, GoogleAuthError
 from app.config import settings
 import uuid
+import logging
+import httpx
+from urllib.parse import urlencode
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -19,19 +23,17 @@ async def register(
     db: AsyncSession = Depends(get_db)
 ):
     """Register new user with email and password"""
-    print(f"DEBUG: Registration attempt for email: {user_data.email}")
+    logger.debug("Registration attempt for email: %s", user_data.email)
     
     # Check if user exists
     existing_user = await get_user_by_email(db, user_data.email)
     if existing_user:
-        print(f"DEBUG: User already exists: {user_data.email}")
+        logger.debug("User already exists: %s", user_data.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    print(f"DEBUG: Creating new user for email: {user_data.email}")
-    
     # Create new user
     user = await create_user(
         db=db,
@@ -42,13 +44,11 @@ async def register(
         plan=user_data.plan or "basic"
     )
     
-    print(f"DEBUG: User created successfully with ID: {user.id}")
+    logger.debug("User created with ID: %s", user.id)
     
     # Generate tokens
     tokens = create_token_response(str(user.id), user.email)
     
-    print(f"DEBUG: Tokens generated for user: {user.email}")
-    
     # TODO: Send verification email
     
     return tokens
@@ -127,38 +127,39 @@ async def google_callback(
     try:
         # Authenticate with Google
         user_info = await google_auth.authenticate(auth_data.code)
-        
-        if not user_info.get("email"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email not provided by Google"
-            )
-        
-        # Get or create user (simplified - no OAuth account tracking)
-        user = await get_user_by_email(db, user_info["email"])
-        if not user:
-            user = await create_user(
-                db=db,
-                email=user_info["email"],
-                full_name=user_info.get("full_name"),
-                is_verified=True  # OAuth users are pre-verified
-            )
-        
-        # Generate tokens
-        tokens = create_token_response(str(user.id), user.email)
-        
-        return tokens
-        
-    except Exception as e:
+    except (GoogleAuthError, httpx.HTTPError) as e:
+        # Details stay in the server log rather than the response
+        logger.warning(f"Google authentication failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Google authentication failed"
+        )
+    
+    if not user_info.get("email"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Google authentication failed: {str(e)}"
+            detail="Email not provided by Google"
         )
+    
+    # Get or create user (simplified - no OAuth account tracking)
+    user = await get_user_by_email(db, user_info["email"])
+    if not user:
+        user = await create_user(
+            db=db,
+            email=user_info["email"],
+            full_name=user_info.get("full_name"),
+            is_verified=True  # OAuth users are pre-verified
+        )
+    
+    # Generate tokens
+    tokens = create_token_response(str(user.id), user.email)
+    
+    return tokens
 
 
 @router.get("/google/callback")
 async def google_callback_redirect(
-    code: str,
+    code: str = Query(..., min_length=1),
     state: str = None,
     db: AsyncSession = Depends(get_db)
 ):
@@ -166,31 +167,36 @@ async def google_callback_redirect(
     try:
         # Authenticate with Google
         user_info = await google_auth.authenticate(code)
-        
-        # Get or create user (simplified - no OAuth account tracking)
-        user = await get_user_by_email(db, user_info["email"])
-        if not user:
-            user = await create_user(
-                db=db,
-                email=user_info["email"],
-                full_name=user_info.get("full_name"),
-                is_verified=True  # OAuth users are pre-verified
-            )
-        
-        # Generate tokens
-        tokens = create_token_response(str(user.id), user.email)
-        
-        # Redirect to frontend with tokens
-        redirect_url = f"{settings.FRONTEND_URL}/auth/callback"
-        redirect_url += f"?access_token={tokens['access_token']}"
-        redirect_url += f"&refresh_token={tokens['refresh_token']}"
-        
-        return RedirectResponse(url=redirect_url)
-        
-    except Exception as e:
-        # Redirect to frontend with error
-        error_url = f"{settings.FRONTEND_URL}/auth/error?message={str(e)}"
+    except (GoogleAuthError, httpx.HTTPError) as e:
+        # Redirect to frontend with a fixed error code; details stay in the server log
+        logger.warning(f"Google authentication failed: {e}")
+        error_url = f"{settings.FRONTEND_URL}/auth/error?" + urlencode({"message": "oauth_failed"})
+        return RedirectResponse(url=error_url)
+    
+    if not user_info.get("email"):
+        error_url = f"{settings.FRONTEND_URL}/auth/error?" + urlencode({"message": "email_not_provided"})
         return RedirectResponse(url=error_url)
+    
+    # Get or create user (simplified - no OAuth account tracking)
+    user = await get_user_by_email(db, user_info["email"])
+    if not user:
+        user = await create_user(
+            db=db,
+            email=user_info["email"],
+            full_name=user_info.get("full_name"),
+            is_verified=True  # OAuth users are pre-verified
+        )
+    
+    # Generate tokens
+    tokens = create_token_response(str(user.id), user.email)
+    
+    # Redirect to frontend with tokens
+    redirect_url = f"{settings.FRONTEND_URL}/auth/callback?" + urlencode({
+        "access_token": tokens["access_token"],
+        "refresh_token": tokens["refresh_token"]
+    })
+    
+    return RedirectResponse(url=redirect_url)
 
 
 @router.post("/logout")
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from app.database import get_db
+from sqlalchemy import select, and_, func, case, column
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database import get_db, get_async_session
 from app.api.deps import get_current_user, get_current_verified_user, get_user_organization
 from app.models.user import User
 from app.models.organization import Organization
@@ -9,17 +12,77 @@ from app.models.document import Document, DocumentAnalysis, AnalysisStatus
 from app.models.jurisdiction import Jurisdiction, OrganizationJurisdiction
 from app.models.compliance import ComplianceTask, ComplianceRequirement, ComplianceAssessment, AssessmentSession
 from app.services.document_assessor import document_assessor
+from app.services.document_processor import document_processor, FileTooLargeError
 from app.services.form_generator import form_generator
+from app.services.snapshot_cache import dashboard_cache
 from fastapi import UploadFile, File, BackgroundTasks
 from app.config import settings
 import os
-import aiofiles
-from typing import Dict, Any, List
-from uuid import UUID
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID, uuid4
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Sort ranks for gaps and rules (lower sorts first)
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+STATUS_ORDER = {"non_compliant": 0, "partial": 1, "compliant": 2, "not_assessed": 3}
+
+# Assessment uploads; the directory is created once at startup
+ASSESSMENT_MAX_FILE_SIZE = getattr(settings, 'MAX_FILE_SIZE', 10 * 1024 * 1024)  # 10MB default
+ASSESSMENT_DIR = os.path.join(getattr(settings, 'UPLOAD_DIR', 'uploads'), 'assessments')
+os.makedirs(ASSESSMENT_DIR, exist_ok=True)
+
+# Map frontend regulation filter values to backend enum values
+REGULATION_FILTER_MAPPING = {
+    "iso42001": "iso_42001",
+    "eu_ai_act": "eu_ai_act",
+    "us_ai_governance": "us_ai_governance"
+}
+
+
+# Rows for the gap and rule listings. Slotted dataclasses are smaller and
+# cheaper to build than dicts, and orjson serializes them natively with
+# the same JSON keys.
+@dataclass(slots=True)
+class ComplianceGap:
+    rule_id: Optional[str]
+    rule_title: Optional[str]
+    status: str
+    severity: str
+    explanation: Optional[str]
+    recommendation: Optional[str]
+    confidence: float
+
+
+@dataclass(slots=True)
+class GapRecommendation:
+    rule_id: Optional[str]
+    recommendation: str
+    priority: str
+
+
+@dataclass(slots=True)
+class ComplianceRule:
+    id: str
+    title: str
+    regulation: str
+    regulation_type: str
+    severity: str
+    status: str
+    description: str
+    evidence: str
+    page_number: Optional[int]
+    section_reference: Optional[str]
+    category: str
+    recommendation: Optional[str]
+    confidence: int
+    last_updated: datetime
 
 
 @router.post("/analyze")
@@ -31,21 +94,21 @@ async def analyze_compliance(
 ):
     """Get compliance analysis results for a document"""
     
-    # Get document and its analysis
+    # Get document and its most recent analysis as one deterministic row
     result = await db.execute(
-        select(Document, DocumentAnalysis).outerjoin(DocumentAnalysis).where(
+        select(Document.id, DocumentAnalysis).outerjoin(DocumentAnalysis).where(
             and_(
                 Document.id == document_id,
                 Document.organization_id == organization.id
             )
-        )
+        ).order_by(DocumentAnalysis.created_at.desc().nulls_last()).limit(1)
     )
     
     row = result.first()
     if not row:
         raise HTTPException(status_code=404, detail="Document not found")
     
-    document, analysis = row
+    _, analysis = row
     
     if not analysis:
         raise HTTPException(
@@ -63,134 +126,186 @@ async def analyze_compliance(
     return {
         "document_id": str(document_id),
         "analysis_result": analysis.result,
-        "completed_at": analysis.completed_at.isoformat(),
+        "completed_at": analysis.completed_at,
         "status": "completed"
     }
 
 
+def _completed_analyses_filter(organization_id):
+    """Completed analyses with a result, for documents of the organization"""
+    return and_(
+        Document.organization_id == organization_id,
+        DocumentAnalysis.status == AnalysisStatus.COMPLETED,
+        func.jsonb_typeof(DocumentAnalysis.result) == 'object'
+    )
+
+
+async def _get_compliance_summary(db: AsyncSession, organization_id) -> Tuple[Dict[str, Any], int]:
+    """
+    Aggregate rule counts across the organization's completed analyses in SQL
+    Returns: (overall_stats, total_analyses)
+    """
+    def summary_count(key: str):
+        return func.coalesce(
+            func.sum(DocumentAnalysis.result[("summary", key)].as_integer()), 0
+        )
+
+    result = await db.execute(
+        select(
+            func.count(DocumentAnalysis.id),
+            summary_count("conforming"),
+            summary_count("partial"),
+            summary_count("non_conforming")
+        )
+        .select_from(DocumentAnalysis)
+        .join(Document)
+        .where(_completed_analyses_filter(organization_id))
+    )
+    total_analyses, conforming, partial, non_conforming = result.one()
+
+    overall_stats = {
+        "total_rules": conforming + partial + non_conforming,
+        "conforming": conforming,
+        "partial": partial,
+        "non_conforming": non_conforming,
+        "overall_score": 0
+    }
+
+    # Calculate overall score
+    if overall_stats["total_rules"] > 0:
+        score = (
+            (conforming * 100 + partial * 50) /
+            overall_stats["total_rules"]
+        )
+        overall_stats["overall_score"] = round(score, 1)
+
+    return overall_stats, total_analyses
+
+
 @router.get("/results")
 async def get_compliance_results(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all compliance analysis results for organization"""
     
-    # Get all completed analyses for the organization
+    # Overall stats are aggregated by the database rather than by summing
+    # every analysis result here
+    overall_stats, total_analyses = await _get_compliance_summary(db, organization.id)
+    
+    # Get the requested page of completed analyses
     result = await db.execute(
         select(Document, DocumentAnalysis).join(DocumentAnalysis).where(
-            and_(
-                Document.organization_id == organization.id,
-                DocumentAnalysis.status == AnalysisStatus.COMPLETED
-            )
-        ).order_by(DocumentAnalysis.completed_at.desc())
+            _completed_analyses_filter(organization.id)
+        ).order_by(DocumentAnalysis.completed_at.desc(), DocumentAnalysis.id).offset(skip).limit(limit)
     )
     
     analyses = []
-    overall_stats = {
-        "total_rules": 0,
-        "conforming": 0,
-        "partial": 0,
-        "non_conforming": 0,
-        "overall_score": 0
-    }
-    
     for document, analysis in result:
-        if analysis.result:
-            analysis_data = {
-                "document_id": str(document.id),
-                "document_name": document.filename,
-                "analysis_id": str(analysis.id),
-                "completed_at": analysis.completed_at.isoformat(),
-                "result": analysis.result
-            }
-            analyses.append(analysis_data)
-            
-            # Aggregate stats
-            if "summary" in analysis.result:
-                summary = analysis.result["summary"]
-                overall_stats["conforming"] += summary.get("conforming", 0)
-                overall_stats["partial"] += summary.get("partial", 0)
-                overall_stats["non_conforming"] += summary.get("non_conforming", 0)
-                overall_stats["total_rules"] += (
-                    summary.get("conforming", 0) + 
-                    summary.get("partial", 0) + 
-                    summary.get("non_conforming", 0)
-                )
-    
-    # Calculate overall score
-    if overall_stats["total_rules"] > 0:
-        score = (
-            (overall_stats["conforming"] * 100 + overall_stats["partial"] * 50) / 
-            overall_stats["total_rules"]
-        )
-        overall_stats["overall_score"] = round(score, 1)
+        analyses.append({
+            "document_id": str(document.id),
+            "document_name": document.filename,
+            "analysis_id": str(analysis.id),
+            "completed_at": analysis.completed_at,
+            "result": analysis.result
+        })
     
-    return {
+    return ORJSONResponse({
         "analyses": analyses,
         "summary": overall_stats,
-        "total_analyses": len(analyses)
-    }
+        "total_analyses": total_analyses,
+        "skip": skip,
+        "limit": limit
+    })
 
 
 @router.get("/gaps")
 async def get_compliance_gaps(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
 ):
     """Get compliance gaps and recommendations"""
     
-    # Get all completed analyses
-    result = await db.execute(
-        select(DocumentAnalysis).join(Document).where(
-            and_(
-                Document.organization_id == organization.id,
-                DocumentAnalysis.status == AnalysisStatus.COMPLETED
-            )
-        )
+    # Expand each completed analysis into its rules and keep only the gaps,
+    # so the database does the filtering and only matching rule objects
+    # are sent back rather than every full analysis result
+    rules = DocumentAnalysis.result["compliance_rules"]
+    rule_elements = (
+        func.jsonb_array_elements(rules)
+        .table_valued(column("rule", JSONB), with_ordinality="position", joins_implicitly=True)
+        .render_derived(name="rule_element")
+    )
+    rule = rule_elements.c.rule
+    severity_expr = func.coalesce(rule["severity"].astext, "medium")
+    gap_filter = and_(
+        _completed_analyses_filter(organization.id),
+        func.jsonb_typeof(rules) == 'array',
+        rule["status"].astext.in_(["partial", "non_conform"])
     )
     
-    analyses = result.scalars().all()
-    gaps = []
-    recommendations = []
+    counts_result = await db.execute(
+        select(func.count(), func.count().filter(severity_expr.in_(("critical", "high"))))
+        .select_from(DocumentAnalysis)
+        .join(Document)
+        .where(gap_filter)
+    )
+    total_gaps, critical_gaps = counts_result.one()
+    
+    # Sort by severity and confidence, then return the requested page; the
+    # analysis id and position in its rules array break ties, so OFFSET
+    # pages don't overlap
+    result = await db.scalars(
+        select(rule)
+        .select_from(DocumentAnalysis)
+        .join(Document)
+        .where(gap_filter)
+        .order_by(
+            case(SEVERITY_ORDER, value=severity_expr, else_=4),
+            rule["confidence"].as_float().desc().nulls_last(),
+            DocumentAnalysis.id,
+            rule_elements.c.position
+        )
+        .offset(skip)
+        .limit(limit)
+    )
     
-    for analysis in analyses:
-        if analysis.result and "compliance_rules" in analysis.result:
-            rules = analysis.result["compliance_rules"]
-            
-            for rule in rules:
-                if rule.get("status") in ["partial", "non_conform"]:
-                    gap = {
-                        "rule_id": rule.get("rule_id"),
-                        "rule_title": rule.get("rule_title"),
-                        "status": rule.get("status"),
-                        "severity": rule.get("severity", "medium"),
-                        "explanation": rule.get("explanation"),
-                        "recommendation": rule.get("recommendation"),
-                        "confidence": rule.get("confidence", 0)
-                    }
-                    gaps.append(gap)
-                    
-                    if rule.get("recommendation"):
-                        recommendations.append({
-                            "rule_id": rule.get("rule_id"),
-                            "recommendation": rule.get("recommendation"),
-                            "priority": "high" if rule.get("status") == "non_conform" else "medium"
-                        })
-    
-    # Sort by severity and confidence
-    gaps.sort(key=lambda x: (
-        0 if x["severity"] == "high" else 1 if x["severity"] == "medium" else 2,
-        -x["confidence"]
-    ))
+    page = [
+        ComplianceGap(
+            rule_id=gap.get("rule_id"),
+            rule_title=gap.get("rule_title"),
+            status=gap["status"],
+            severity=gap.get("severity", "medium"),
+            explanation=gap.get("explanation"),
+            recommendation=gap.get("recommendation"),
+            confidence=gap.get("confidence", 0)
+        )
+        for gap in result
+    ]
+    
+    # Recommendations for the gaps on this page
+    recommendations = [
+        GapRecommendation(
+            rule_id=gap.rule_id,
+            recommendation=gap.recommendation,
+            priority="high" if gap.status == "non_conform" else "medium"
+        )
+        for gap in page if gap.recommendation
+    ]
     
-    return {
-        "gaps": gaps,
+    return ORJSONResponse({
+        "gaps": page,
         "recommendations": recommendations,
-        "total_gaps": len(gaps),
-        "critical_gaps": len([g for g in gaps if g["severity"] == "high"])
-    }
+        "total_gaps": total_gaps,
+        "critical_gaps": critical_gaps,
+        "skip": skip,
+        "limit": limit
+    })
 
 
 @router.get("/rules")
@@ -198,6 +313,8 @@ async def get_compliance_rules(
     regulation_filter: str = None,
     status_filter: str = None,
     severity_filter: str = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
@@ -213,132 +330,161 @@ async def get_compliance_rules(
     org_jurisdictions = org_jurisdictions_result.scalars().all()
     
     if not org_jurisdictions:
-        return {"rules": [], "summary": {"total": 0, "conforming": 0, "partial": 0, "non_conforming": 0}}
+        return ORJSONResponse({"rules": [], "summary": {"total": 0, "conforming": 0, "partial": 0, "non_conforming": 0}, "skip": skip, "limit": limit})
     
-    jurisdiction_ids = [j.id for j in org_jurisdictions]
+    # Apply regulation filter to the already-loaded jurisdictions
+    if regulation_filter and regulation_filter != "all":
+        mapped_filter = REGULATION_FILTER_MAPPING.get(regulation_filter, regulation_filter)
+        org_jurisdictions = [j for j in org_jurisdictions if j.regulation_type.value == mapped_filter]
+    
+    # Regulation details per jurisdiction, looked up for each rule below
+    regulations = {j.id: (j.name, j.regulation_type.value) for j in org_jurisdictions}
+    
+    # Latest assessment per requirement for this organization; each
+    # assessment session adds new rows, so older ones are superseded
+    latest_subquery = (
+        select(ComplianceAssessment)
+        .where(ComplianceAssessment.organization_id == organization.id)
+        .distinct(ComplianceAssessment.requirement_id)
+        .order_by(ComplianceAssessment.requirement_id, ComplianceAssessment.created_at.desc())
+        .subquery()
+    )
+    latest_assessment = aliased(ComplianceAssessment, latest_subquery)
     
-    # Get compliance requirements for selected jurisdictions
-    requirements_query = select(ComplianceRequirement).where(
-        and_(
-            ComplianceRequirement.jurisdiction_id.in_(jurisdiction_ids),
-            ComplianceRequirement.is_active == True
-        )
-    ).join(Jurisdiction)
+    # Requirements without an assessment are "not_assessed"
+    status_expr = func.coalesce(func.lower(latest_assessment.status), "not_assessed")
+    severity_expr = func.lower(ComplianceRequirement.criticality)
     
-    # Apply regulation filter
-    if regulation_filter and regulation_filter != "all":
-        # Map frontend filter values to backend enum values
-        regulation_mapping = {
-            "iso42001": "iso_42001",
-            "eu_ai_act": "eu_ai_act",
-            "us_ai_governance": "us_ai_governance"
-        }
-        mapped_filter = regulation_mapping.get(regulation_filter, regulation_filter)
-        requirements_query = requirements_query.where(
-            Jurisdiction.regulation_type == mapped_filter
-        )
+    conditions = [
+        ComplianceRequirement.jurisdiction_id.in_(list(regulations)),
+        ComplianceRequirement.is_active == True
+    ]
     
     # Apply severity filter
     if severity_filter and severity_filter != "all":
-        requirements_query = requirements_query.where(
-            ComplianceRequirement.criticality.ilike(f"%{severity_filter}%")
-        )
-    
-    result = await db.execute(requirements_query.order_by(ComplianceRequirement.requirement_id))
-    requirements = result.scalars().all()
-    
-    # Get assessments for these requirements
-    assessments_result = await db.execute(
-        select(ComplianceAssessment).where(
-            and_(
-                ComplianceAssessment.organization_id == organization.id,
-                ComplianceAssessment.requirement_id.in_([r.id for r in requirements])
-            )
+        conditions.append(ComplianceRequirement.criticality.ilike(f"%{severity_filter}%"))
+    
+    # Apply status filter
+    if status_filter and status_filter != "all":
+        conditions.append(status_expr == status_filter)
+    
+    # Summary counts come from the database, grouped by status and severity
+    summary_result = await db.execute(
+        select(status_expr, severity_expr, func.count())
+        .select_from(ComplianceRequirement)
+        .outerjoin(latest_assessment, latest_assessment.requirement_id == ComplianceRequirement.id)
+        .where(and_(*conditions))
+        .group_by(status_expr, severity_expr)
+    )
+    status_counts = Counter()
+    severity_counts = Counter()
+    for status, severity, count in summary_result:
+        status_counts[status] += count
+        severity_counts[severity] += count
+    
+    # Get the requested page of compliance requirements for selected
+    # jurisdictions along with their assessment
+    result = await db.execute(
+        select(ComplianceRequirement, latest_assessment)
+        .outerjoin(latest_assessment, latest_assessment.requirement_id == ComplianceRequirement.id)
+        .where(and_(*conditions))
+        .order_by(
+            # Sort by severity and status, assessed requirements first
+            case(SEVERITY_ORDER, value=severity_expr, else_=4),
+            case(STATUS_ORDER, value=status_expr, else_=4),
+            latest_assessment.id.is_(None),
+            ComplianceRequirement.requirement_id,
+            ComplianceRequirement.id  # requirement_id isn't unique; keeps pages stable
         )
+        .offset(skip)
+        .limit(limit)
     )
-    assessments = {a.requirement_id: a for a in assessments_result.scalars().all()}
     
     # Build rules list
     rules_list = []
     
-    for requirement in requirements:
-        assessment = assessments.get(requirement.id)
-        
+    for requirement, assessment in result:
         # Determine status
         if assessment:
             status = assessment.status.lower()
             evidence = f"Evidence from assessment: {assessment.explanation or 'No explanation'}"
-            last_updated = assessment.assessed_at.isoformat() if assessment.assessed_at else assessment.created_at.isoformat()
+            last_updated = assessment.assessed_at or assessment.created_at
         else:
             status = "not_assessed"
             evidence = "No assessment completed"
-            last_updated = requirement.created_at.isoformat()
-        
-        # Apply status filter
-        if status_filter and status_filter != "all" and status != status_filter:
-            continue
+            last_updated = requirement.created_at
         
-        rule = {
-            "id": requirement.requirement_id,
-            "title": requirement.title,
-            "regulation": requirement.jurisdiction.name,
-            "regulation_type": requirement.jurisdiction.regulation_type.value,
-            "severity": requirement.criticality.lower(),
-            "status": status,
-            "description": requirement.description,
-            "evidence": evidence,
-            "page_number": requirement.page_number,
-            "section_reference": requirement.section_reference,
-            "category": requirement.category,
-            "recommendation": assessment.gap_description if assessment else "Complete assessment to get recommendations",
-            "confidence": 95 if assessment else 0,  # High confidence for extracted requirements
-            "last_updated": last_updated
-        }
+        regulation_name, regulation_type = regulations[requirement.jurisdiction_id]
         
-        rules_list.append(rule)
-    
-    # Sort by severity and status
-    def sort_key(rule):
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        status_order = {"non_compliant": 0, "partial": 1, "compliant": 2, "not_assessed": 3}
-        return (
-            severity_order.get(rule["severity"], 4),
-            status_order.get(rule["status"], 4),
-            -rule["confidence"]
-        )
-    
-    rules_list.sort(key=sort_key)
-    
-    # Calculate summary
+        rules_list.append(ComplianceRule(
+            id=requirement.requirement_id,
+            title=requirement.title,
+            regulation=regulation_name,
+            regulation_type=regulation_type,
+            severity=requirement.criticality.lower(),
+            status=status,
+            description=requirement.description,
+            evidence=evidence,
+            page_number=requirement.page_number,
+            section_reference=requirement.section_reference,
+            category=requirement.category,
+            recommendation=assessment.gap_description if assessment else "Complete assessment to get recommendations",
+            confidence=95 if assessment else 0,  # High confidence for extracted requirements
+            last_updated=last_updated
+        ))
+    
+    # Calculate summary; counts are keyed by the rule statuses above
+    # ('compliant', 'partial', 'non_compliant', 'not_assessed')
     summary = {
-        "total": len(rules_list),
-        "conforming": len([r for r in rules_list if r["status"] == "conform"]),
-        "partial": len([r for r in rules_list if r["status"] == "partial"]),
-        "non_conforming": len([r for r in rules_list if r["status"] == "non_conform"]),
-        "high_severity": len([r for r in rules_list if r["severity"] == "high"])
+        "total": sum(status_counts.values()),
+        "conforming": status_counts["compliant"],
+        "partial": status_counts["partial"],
+        "non_conforming": status_counts["non_compliant"],
+        "high_severity": severity_counts["high"]
     }
     
-    return {
+    return ORJSONResponse({
         "rules": rules_list,
-        "summary": summary
-    }
+        "summary": summary,
+        "skip": skip,
+        "limit": limit
+    })
 
 
 @router.get("/dashboard")
 async def get_compliance_dashboard(
+    request: Request,
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
 ):
     """Get compliance dashboard data"""
     
-    # Check if jurisdictions exist - no automatic seeding
-    jurisdictions_result = await db.execute(select(Jurisdiction))
-    if not jurisdictions_result.first():
-        logger.warning("No jurisdictions found. Upload compliance documents to create jurisdictions.")
+    # Serve a recent snapshot when there is one; otherwise rebuild it, once
+    # per organization even when several requests miss together
+    snapshot = dashboard_cache.get(organization.id)
+    if not snapshot:
+        async with dashboard_cache.lock(organization.id):
+            snapshot = dashboard_cache.get(organization.id)
+            if not snapshot:
+                generation = dashboard_cache.generation(organization.id)
+                payload = await _build_compliance_dashboard(db, organization.id)
+                snapshot = dashboard_cache.set(organization.id, payload, generation)
+    
+    body, etag, _ = snapshot
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _build_compliance_dashboard(db: AsyncSession, organization_id) -> Dict[str, Any]:
+    """Compute the compliance dashboard payload for an organization"""
     
     # Get overall compliance stats
-    compliance_results = await get_compliance_results(current_user, organization, db)
+    compliance_summary, total_analyses = await _get_compliance_summary(db, organization_id)
     
     # Get task statistics
     tasks_result = await db.execute(
@@ -347,7 +493,7 @@ async def get_compliance_dashboard(
             ComplianceTask.priority,
             func.count(ComplianceTask.id).label("count")
         ).where(
-            ComplianceTask.organization_id == organization.id
+            ComplianceTask.organization_id == organization_id
         ).group_by(ComplianceTask.status, ComplianceTask.priority)
     )
     
@@ -358,39 +504,44 @@ async def get_compliance_dashboard(
         task_stats[status.value]["total"] += count
         task_stats[status.value][priority.value] += count
     
-    # Get recent documents
+    # Get recent documents, selecting only the columns the dashboard shows
     recent_docs_result = await db.execute(
-        select(Document).where(
-            Document.organization_id == organization.id
+        select(
+            Document.id,
+            Document.filename,
+            Document.upload_date,
+            Document.document_type
+        ).where(
+            Document.organization_id == organization_id
         ).order_by(Document.upload_date.desc()).limit(5)
     )
     
     recent_documents = []
-    for doc in recent_docs_result.scalars():
+    for doc in recent_docs_result:
         recent_documents.append({
             "id": str(doc.id),
             "filename": doc.filename,
-            "upload_date": doc.upload_date.isoformat(),
+            "upload_date": doc.upload_date,
             "document_type": doc.document_type.value
         })
     
     return {
-        "compliance_summary": compliance_results["summary"],
+        "compliance_summary": compliance_summary,
         "task_statistics": task_stats,
         "recent_documents": recent_documents,
-        "total_analyses": compliance_results["total_analyses"]
+        "total_analyses": total_analyses
     }
 
 
-@router.post("/assess-document")
+@router.post("/assess-document", status_code=202)
 async def assess_company_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    background_tasks: BackgroundTasks = None,
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
 ):
-    """Assess a company document against compliance requirements"""
+    """Upload a company document for assessment against compliance requirements"""
     
     # Validate file format
     supported_extensions = ['.pdf', '.docx', '.doc', '.txt']
@@ -401,77 +552,124 @@ async def assess_company_document(
             detail="Unsupported file format. Supported formats: PDF, DOCX, DOC, TXT"
         )
     
-    # Validate file size
-    content = await file.read()
-    max_size = getattr(settings, 'MAX_FILE_SIZE', 10 * 1024 * 1024)  # 10MB default
-    if len(content) > max_size:
+    # Generate unique filename
+    safe_filename = f"{time.time_ns()}_{file.filename}"
+    file_path = os.path.join(ASSESSMENT_DIR, safe_filename)
+    
+    # Stream file to disk, validating size as it arrives
+    try:
+        await document_processor.save_upload_file(file, file_path, ASSESSMENT_MAX_FILE_SIZE)
+    except FileTooLargeError:
         raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {max_size // 1024 // 1024}MB"
+            status_code=413,
+            detail=f"File too large. Maximum size: {ASSESSMENT_MAX_FILE_SIZE // 1024 // 1024}MB"
         )
     
-    # Ensure upload directory exists
-    upload_dir = getattr(settings, 'UPLOAD_DIR', 'uploads')
-    assessment_dir = os.path.join(upload_dir, 'assessments')
-    os.makedirs(assessment_dir, exist_ok=True)
-    
-    # Save file
-    from datetime import datetime
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_filename = f"{timestamp}_{file.filename}"
-    file_path = os.path.join(assessment_dir, safe_filename)
+    # Create the assessment session up front so clients can poll it
+    session = AssessmentSession(
+        id=uuid4(),
+        organization_id=organization.id,
+        session_type="document_upload",
+        source_document_name=file.filename,
+        source_document_path=file_path,
+        created_by=current_user.id,
+        processing_status='processing'
+    )
+    db.add(session)
+    await db.commit()
+    
+    # Queue the assessment once the session is persisted
+    background_tasks.add_task(
+        process_document_assessment,
+        session.id,
+        organization.id,
+        file_path,
+        file.filename,
+        current_user.id
+    )
     
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(content)
+    return {
+        "message": "Document uploaded. Assessment will begin shortly.",
+        "session_id": str(session.id),
+        "status": "processing"
+    }
+
+
+async def process_document_assessment(
+    session_id: UUID,
+    organization_id: UUID,
+    file_path: str,
+    filename: str,
+    user_id: UUID
+):
+    """Background task to assess a company document"""
     
-    try:
-        # Perform assessment
-        result = await document_assessor.assess_document(
-            organization.id,
-            file_path,
-            file.filename,
-            db,
-            current_user.id
-        )
-        
-        logger.info(f"Document assessment completed for {organization.name}: {result['overall_score']}%")
-        
-        return {
-            "message": "Document assessment completed",
-            "assessment_results": result
-        }
-        
-    except Exception as e:
-        logger.error(f"Document assessment failed: {e}")
-        # Clean up uploaded file on error
+    async with get_async_session() as db:
         try:
-            os.remove(file_path)
-        except:
-            pass
-        raise HTTPException(
-            status_code=500,
-            detail=f"Assessment failed: {str(e)}"
-        )
+            result = await document_assessor.assess_document(
+                organization_id,
+                file_path,
+                filename,
+                db,
+                user_id,
+                session_id=session_id
+            )
+            
+            logger.info(f"Document assessment completed for session {session_id}: {result['overall_score']}%")
+            
+        except Exception as e:
+            logger.error(f"Document assessment failed for session {session_id}: {e}")
+            
+            # assess_document has rolled back; record the failure on the session
+            session = await db.get(AssessmentSession, session_id)
+            session.processing_status = 'failed'
+            await db.commit()
+            
+            # Clean up uploaded file on error
+            await document_processor.remove_file(file_path)
 
 
 @router.get("/assessment-sessions")
 async def get_assessment_sessions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get all assessment sessions for the organization"""
+    """Get assessment sessions for the organization, newest first"""
     
-    result = await db.execute(
-        select(AssessmentSession)
+    total_sessions = await db.scalar(
+        select(func.count())
+        .select_from(AssessmentSession)
         .where(AssessmentSession.organization_id == organization.id)
-        .order_by(AssessmentSession.created_at.desc())
     )
     
-    sessions = result.scalars().all()
+    # Only the summary columns are listed, so select them rather than
+    # hydrating full ORM objects
+    result = await db.execute(
+        select(
+            AssessmentSession.id,
+            AssessmentSession.session_type,
+            AssessmentSession.source_document_name,
+            AssessmentSession.overall_score,
+            AssessmentSession.total_requirements,
+            AssessmentSession.compliant_count,
+            AssessmentSession.partial_count,
+            AssessmentSession.non_compliant_count,
+            AssessmentSession.not_addressed_count,
+            AssessmentSession.processing_status,
+            AssessmentSession.created_at,
+            AssessmentSession.completed_at
+        )
+        .where(AssessmentSession.organization_id == organization.id)
+        .order_by(AssessmentSession.created_at.desc(), AssessmentSession.id)
+        .offset(skip)
+        .limit(limit)
+    )
     
     session_data = []
-    for session in sessions:
+    for session in result:
         session_data.append({
             "id": str(session.id),
             "session_type": session.session_type,
@@ -482,14 +680,17 @@ async def get_assessment_sessions(
             "partial_count": session.partial_count,
             "non_compliant_count": session.non_compliant_count,
             "not_addressed_count": session.not_addressed_count,
-            "created_at": session.created_at.isoformat(),
-            "completed_at": session.completed_at.isoformat() if session.completed_at else None
+            "processing_status": session.processing_status,
+            "created_at": session.created_at,
+            "completed_at": session.completed_at
         })
     
-    return {
+    return ORJSONResponse({
         "sessions": session_data,
-        "total_sessions": len(session_data)
-    }
+        "total_sessions": total_sessions,
+        "skip": skip,
+        "limit": limit
+    })
 
 
 @router.get("/assessment-sessions/{session_id}")
@@ -516,9 +717,11 @@ async def get_assessment_session_details(
     if not session:
         raise HTTPException(status_code=404, detail="Assessment session not found")
     
-    # Get detailed assessments with requirement info
+    # Get detailed assessments with requirement info; only the jurisdiction
+    # columns shown are selected, so its requirements_data JSON isn't
+    # repeated on every row
     assessments_result = await db.execute(
-        select(ComplianceAssessment, ComplianceRequirement, Jurisdiction)
+        select(ComplianceAssessment, ComplianceRequirement, Jurisdiction.name, Jurisdiction.regulation_type)
         .join(ComplianceRequirement)
         .join(Jurisdiction)
         .where(ComplianceAssessment.session_id == session_id)
@@ -526,7 +729,7 @@ async def get_assessment_session_details(
     )
     
     assessments = []
-    for assessment, requirement, jurisdiction in assessments_result:
+    for assessment, requirement, jurisdiction_name, regulation_type in assessments_result:
         assessments.append({
             "id": str(assessment.id),
             "requirement": {
@@ -538,18 +741,18 @@ async def get_assessment_session_details(
                 "criticality": requirement.criticality
             },
             "jurisdiction": {
-                "name": jurisdiction.name,
-                "regulation_type": jurisdiction.regulation_type.value
+                "name": jurisdiction_name,
+                "regulation_type": regulation_type.value
             },
             "status": assessment.status,
             "evidence_text": assessment.evidence_text,
             "gap_description": assessment.gap_description,
             "recommendation": assessment.recommendation,
             "confidence_score": assessment.confidence_score,
-            "assessed_at": assessment.assessed_at.isoformat() if assessment.assessed_at else None
+            "assessed_at": assessment.assessed_at
         })
     
-    return {
+    return ORJSONResponse({
         "session": {
             "id": str(session.id),
             "session_type": session.session_type,
@@ -560,8 +763,9 @@ async def get_assessment_session_details(
             "partial_count": session.partial_count,
             "non_compliant_count": session.non_compliant_count,
             "not_addressed_count": session.not_addressed_count,
-            "created_at": session.created_at.isoformat(),
-            "completed_at": session.completed_at.isoformat() if session.completed_at else None
+            "processing_status": session.processing_status,
+            "created_at": session.created_at,
+            "completed_at": session.completed_at
         },
         "assessments": assessments,
         "summary": {
@@ -572,21 +776,15 @@ async def get_assessment_session_details(
                 "non_compliant": session.non_compliant_count,
                 "not_addressed": session.not_addressed_count
             },
-            "by_criticality": self._calculate_criticality_breakdown(assessments)
+            "by_criticality": _calculate_criticality_breakdown(assessments)
         }
-    }
+    })
 
 
 def _calculate_criticality_breakdown(assessments: List[Dict]) -> Dict[str, int]:
     """Calculate breakdown by criticality level"""
-    breakdown = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    
-    for assessment in assessments:
-        criticality = assessment.get("requirement", {}).get("criticality", "MEDIUM")
-        if criticality in breakdown:
-            breakdown[criticality] += 1
-    
-    return breakdown
+    counts = Counter(assessment["requirement"]["criticality"] for assessment in assessments)
+    return {level: counts[level] for level in ("CRITICAL", "HIGH", "MEDIUM", "LOW")}
 
 
 @router.get("/generate-questionnaire/{jurisdiction_id}")
@@ -620,7 +818,7 @@ async def generate_questionnaire(
         
         questionnaire_data = await form_generator.generate_questionnaire(
             db,
-            jurisdiction_id
+            jurisdiction
         )
         
         return {
@@ -661,20 +859,22 @@ async def submit_questionnaire(
                 detail="Invalid submission data. Missing responses or questionnaire_data."
             )
         
-        # Verify user has access to this jurisdiction  
-        jurisdiction_result = await db.execute(
-            select(Jurisdiction)
-            .join(OrganizationJurisdiction)
-            .where(
-                and_(
-                    Jurisdiction.id == jurisdiction_id,
-                    OrganizationJurisdiction.organization_id == organization.id
+        # Verify user has access to this jurisdiction; nothing else about it
+        # is needed here
+        has_access = await db.scalar(
+            select(
+                select(OrganizationJurisdiction.id)
+                .where(
+                    and_(
+                        OrganizationJurisdiction.jurisdiction_id == jurisdiction_id,
+                        OrganizationJurisdiction.organization_id == organization.id
+                    )
                 )
+                .exists()
             )
         )
-        jurisdiction = jurisdiction_result.scalar_one_or_none()
         
-        if not jurisdiction:
+        if not has_access:
             raise HTTPException(
                 status_code=404, 
                 detail="Jurisdiction not found or not accessible"
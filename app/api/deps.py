@@ -1,4 +1,5 @@
 from typing import Optional
+from dataclasses import dataclass
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,7 +7,6 @@ from sqlalchemy import select
 from jose import JWTError
 from app.database import get_db
 from app.core.security import decode_token
-from app.core.auth import get_user_by_id
 from app.models.user import User
 from app.models.organization import Organization, UserOrganization, UserRole
 import uuid
@@ -14,11 +14,23 @@ import uuid
 security = HTTPBearer()
 
 
-async def get_current_user(
+@dataclass
+class AuthContext:
+    """Authenticated user with their organization membership, if any"""
+    user: User
+    organization: Optional[Organization]
+    role: Optional[UserRole]
+
+
+async def get_auth_context(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token"""
+) -> AuthContext:
+    """
+    Authenticate the JWT token and load the user together with their
+    organization and role in one query. FastAPI resolves this once per
+    request, so the dependencies below share the result.
+    """
     token = credentials.credentials
     
     # Decode token
@@ -56,21 +68,40 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database
-    user = await get_user_by_id(db, user_id)
-    if not user:
+    # Get user with their organization membership from database. Users can
+    # belong to several organizations; the one they joined first (ties
+    # broken by organization id) is the one requests act on, consistently.
+    result = await db.execute(
+        select(User, Organization, UserOrganization.role)
+        .outerjoin(UserOrganization, UserOrganization.user_id == User.id)
+        .outerjoin(Organization, Organization.id == UserOrganization.organization_id)
+        .where(User.id == user_id)
+        .order_by(UserOrganization.joined_at, UserOrganization.organization_id)
+        .limit(1)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
+    user, organization, role = row
+    
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
     
-    return user
+    return AuthContext(user=user, organization=organization, role=role)
+
+
+async def get_current_user(
+    auth: AuthContext = Depends(get_auth_context)
+) -> User:
+    """Get current authenticated user from JWT token"""
+    return auth.user
 
 
 async def get_current_verified_user(
@@ -98,44 +129,29 @@ async def get_current_superuser(
 
 
 async def get_user_organization(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    auth: AuthContext = Depends(get_auth_context)
 ) -> Organization:
     """Get current user's organization"""
     
-    # Find user's organization
-    result = await db.execute(
-        select(Organization).join(UserOrganization).where(
-            UserOrganization.user_id == current_user.id
-        )
-    )
-    organization = result.scalar_one_or_none()
-    
-    if not organization:
+    if not auth.organization:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No organization found for user. Please create an organization first."
         )
     
-    return organization
+    return auth.organization
 
 
 async def require_admin_role(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    auth: AuthContext = Depends(get_auth_context)
 ) -> User:
     """Require user to have admin or compliance officer role"""
     
     # Check user's role in their organization
-    result = await db.execute(
-        select(UserOrganization).where(UserOrganization.user_id == current_user.id)
-    )
-    user_org = result.scalar_one_or_none()
-    
-    if not user_org or user_org.role not in [UserRole.OWNER, UserRole.ADMIN, UserRole.COMPLIANCE_OFFICER]:
+    if auth.role not in [UserRole.OWNER, UserRole.ADMIN, UserRole.COMPLIANCE_OFFICER]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin or Compliance Officer role required"
         )
     
-    return current_user
\ No newline at end of file
+    return auth.user
\ No newline at end of file
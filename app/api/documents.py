@@ -1,20 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Request, Query
+from fastapi.responses import Response, ORJSONResponse, FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from app.database import get_db
+from sqlalchemy import select, and_, insert, tuple_
+from sqlalchemy.orm import aliased, selectinload
+from app.database import get_db, get_async_session
 from app.api.deps import get_current_user, get_current_verified_user, get_user_organization
 from app.models.user import User
 from app.models.document import Document, DocumentAnalysis, DocumentType, AnalysisStatus
-from app.models.organization import Organization
-from app.models.jurisdiction import Jurisdiction
+from app.models.organization import Organization, UserOrganization, UserRole
+from app.models.jurisdiction import Jurisdiction, OrganizationJurisdiction
 from app.models.compliance import ComplianceRequirement, ComplianceTask, TaskStatus, TaskPriority
-from app.services.document_processor import document_processor
+from app.services.document_processor import document_processor, FileTooLargeError
 from app.services.openai_service import openai_service
+from app.services.snapshot_cache import dashboard_cache, documents_cache
 from app.config import settings
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 import os
-import aiofiles
+import time
+import aiofiles.os
 from datetime import datetime, timedelta
 import logging
 
@@ -24,6 +28,25 @@ router = APIRouter()
 # Ensure upload directory exists
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
+# Frontend document types (and backend values, upper-cased) to enum members;
+# anything else is rejected
+DOCUMENT_TYPE_MAP = {
+    **{member.value.upper(): member for member in DocumentType},
+    "ASSESSMENT": DocumentType.RISK_ASSESSMENT,
+    "AUDIT": DocumentType.AUDIT_REPORT,
+    "TRAINING": DocumentType.OTHER,  # Backend doesn't have training type
+}
+
+# Organization roles whose uploads feed the ComplianceRequirement table
+REQUIREMENT_SOURCE_ROLES = frozenset({UserRole.ADMIN, UserRole.OWNER, UserRole.COMPLIANCE_OFFICER})
+REQUIREMENT_SOURCE_TYPES = frozenset({DocumentType.POLICY, DocumentType.PROCEDURE, DocumentType.COMPLIANCE_CERTIFICATE})
+
+# Rows fetched per round trip when building the document listing
+DOCUMENT_LIST_BATCH_SIZE = 100
+
+# Default page size of the document listing; only this first page is cached
+DOCUMENT_PAGE_SIZE = 50
+
 
 @router.post("/upload")
 async def upload_document(
@@ -44,50 +67,71 @@ async def upload_document(
             detail="Unsupported file format. Supported formats: PDF, DOCX, DOC, TXT"
         )
     
-    # Read file content
-    content = await file.read()
+    # Validate document type before any bytes are read
+    document_type_enum = DOCUMENT_TYPE_MAP.get(document_type.upper())
+    if document_type_enum is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported document type. Supported types: {', '.join(sorted(DOCUMENT_TYPE_MAP))}"
+        )
+    
+    # Generate unique filename
+    filename = f"{time.time_ns()}_{file.filename}"
+    file_path = os.path.join(settings.UPLOAD_DIR, filename)
     
-    if not document_processor.validate_file_size(len(content), settings.MAX_FILE_SIZE):
+    # Stream file to disk, validating size as it arrives
+    try:
+        file_size, content_hash = await document_processor.save_upload_file(file, file_path, settings.MAX_FILE_SIZE)
+    except FileTooLargeError:
         raise HTTPException(
             status_code=400, 
             detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE // 1024 // 1024}MB"
         )
     
-    # Generate unique filename
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{file.filename}"
-    file_path = os.path.join(settings.UPLOAD_DIR, filename)
+    # Reuse an identical document the organization already uploaded instead
+    # of storing it twice and re-running the analysis. Only documents with
+    # an analysis that didn't fail count: one that failed, or never got an
+    # analysis (e.g. text extraction failed), can be retried by uploading again
+    existing_result = await db.execute(
+        select(Document).where(
+            and_(
+                Document.organization_id == organization.id,
+                Document.content_hash == content_hash,
+                Document.analyses.any(DocumentAnalysis.status != AnalysisStatus.FAILED)
+            )
+        ).limit(1)
+    )
+    existing_doc = existing_result.scalar_one_or_none()
+    if existing_doc:
+        await document_processor.remove_file(file_path)
+        return {
+            "id": str(existing_doc.id),
+            "filename": existing_doc.filename,
+            "file_size": file_size,
+            "document_type": existing_doc.document_type.value,
+            "status": "duplicate",
+            "message": "An identical document was already uploaded. The existing document was kept."
+        }
     
-    # Save file
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(content)
-    
-    # Map frontend document types to backend enum values
-    type_mapping = {
-        "POLICY": "policy",
-        "PROCEDURE": "procedure",
-        "ASSESSMENT": "risk_assessment",
-        "AUDIT": "audit_report",
-        "TRAINING": "other",  # Backend doesn't have training type
-        "OTHER": "other"
-    }
-
-    mapped_type = type_mapping.get(document_type, document_type.lower())
-
     # Create document record
     document = Document(
+        id=uuid4(),
         organization_id=organization.id,
         filename=file.filename,
         file_path=file_path,
-        document_type=DocumentType(mapped_type),
+        content_hash=content_hash,
+        file_size=file_size,
+        mime_type=file.content_type,
+        document_type=document_type_enum,
         description=description,
         uploaded_by=current_user.id,
         upload_date=datetime.utcnow()
     )
     
     db.add(document)
-    await db.flush()
-    await db.refresh(document)
+    await db.commit()
+    dashboard_cache.invalidate(organization.id)
+    documents_cache.invalidate(organization.id)
     
     # Start background analysis
     background_tasks.add_task(
@@ -95,15 +139,14 @@ async def upload_document(
         document.id, 
         file_path, 
         file.filename,
-        organization.id,
-        db
+        organization.id
     )
     
     return {
         "id": str(document.id),
         "filename": document.filename,
-        "file_size": len(content),
-        "document_type": document_type,
+        "file_size": file_size,
+        "document_type": document.document_type.value,
         "status": "uploaded",
         "message": "Document uploaded successfully. Analysis started."
     }
@@ -113,114 +156,218 @@ async def analyze_document_background(
     document_id: UUID,
     file_path: str,
     filename: str,
-    organization_id: UUID,
-    db: AsyncSession
+    organization_id: UUID
 ):
     """Background task to analyze document"""
-    try:
-        # Get document and uploader info
-        doc_result = await db.execute(
-            select(Document, User).join(User, Document.uploaded_by == User.id).where(
-                Document.id == document_id
+    
+    # Runs after the response is sent, so it gets its own session rather
+    # than the request's
+    async with get_async_session() as db:
+        try:
+            # Get document, uploader and the uploader's role in the organization
+            doc_result = await db.execute(
+                select(Document, User, UserOrganization.role)
+                .join(User, Document.uploaded_by == User.id)
+                .outerjoin(
+                    UserOrganization,
+                    and_(
+                        UserOrganization.user_id == User.id,
+                        UserOrganization.organization_id == Document.organization_id
+                    )
+                )
+                .where(Document.id == document_id)
             )
-        )
-        doc_info = doc_result.first()
-        if not doc_info:
-            logger.error(f"Document {document_id} not found")
-            return
+            doc_info = doc_result.first()
+            if not doc_info:
+                logger.error(f"Document {document_id} not found")
+                return
 
-        document, uploader = doc_info
-        is_admin = uploader.is_superuser or uploader.organization_role in ['admin', 'owner', 'compliance_officer']
+            document, uploader, uploader_role = doc_info
+            is_admin = uploader.is_superuser or uploader_role in REQUIREMENT_SOURCE_ROLES
 
-        # Extract text from document
-        extracted_text, file_type = document_processor.extract_text_from_file(file_path, filename)
+            # Extract text from document
+            extracted_text, file_type = await document_processor.extract_text(file_path, filename)
 
-        if file_type == 'error':
-            logger.error(f"Failed to extract text from {filename}")
-            return
+            if file_type == 'error':
+                logger.error(f"Failed to extract text from {filename}")
+                return
 
-        # If admin uploaded a compliance document, extract requirements for ComplianceRequirement table
-        if is_admin and document.document_type.value in ['policy', 'procedure', 'compliance_certificate']:
-            await extract_compliance_requirements_from_admin_document(
-                db, document, extracted_text, organization_id
-            )
-        
-        # Get organization's jurisdictions
-        result = await db.execute(
-            select(Jurisdiction).join(Jurisdiction.organizations).where(
-                Jurisdiction.organizations.any(organization_id=organization_id)
-            )
-        )
-        jurisdictions = result.scalars().all()
+            # Organization's jurisdictions with their requirements, loaded once
+            # for both the analysis and the admin requirement extraction
+            jurisdictions = await _get_organization_jurisdictions(db, organization_id)
         
-        if not jurisdictions:
-            logger.warning(f"No jurisdictions found for organization {organization_id}")
-            return
+            if not jurisdictions:
+                logger.warning(f"No jurisdictions found for organization {organization_id}")
+                return
         
-        # Combine all compliance requirements
-        all_rules = []
-        for jurisdiction in jurisdictions:
-            if jurisdiction.requirements:
+            # Combine all compliance requirements
+            all_rules = []
+            for jurisdiction in jurisdictions:
                 all_rules.extend(jurisdiction.requirements)
         
-        # Create analysis record
-        analysis = DocumentAnalysis(
-            document_id=document_id,
-            analysis_type="compliance_check",
-            status=AnalysisStatus.IN_PROGRESS,
-            extracted_text=extracted_text[:5000]  # Store first 5000 chars
-        )
-        
-        db.add(analysis)
-        await db.flush()
+            # Create analysis record
+            analysis = DocumentAnalysis(
+                document_id=document_id,
+                analysis_type="compliance_check",
+                status=AnalysisStatus.IN_PROGRESS,
+                extracted_text=extracted_text[:5000]  # Store first 5000 chars
+            )
         
-        # Perform AI analysis
-        analysis_result = await openai_service.analyze_document_compliance(
-            extracted_text, 
-            all_rules,
-            "policy"  # Default document type
-        )
+            db.add(analysis)
+            await db.flush()
         
-        # Update analysis with results
-        analysis.status = AnalysisStatus.COMPLETED
-        analysis.result = analysis_result
-        analysis.completed_at = datetime.utcnow()
+            # Perform AI analysis
+            analysis_result = await openai_service.analyze_document_compliance(
+                extracted_text, 
+                all_rules,
+                "policy"  # Default document type
+            )
         
-        await db.commit()
-        logger.info(f"Document analysis completed for {filename}")
+            # Update analysis with results
+            analysis.status = AnalysisStatus.COMPLETED
+            analysis.result = analysis_result
+            analysis.completed_at = datetime.utcnow()
         
-    except Exception as e:
-        logger.error(f"Document analysis failed for {filename}: {e}")
-        # Mark analysis as failed
-        try:
-            analysis.status = AnalysisStatus.FAILED
-            analysis.error_message = str(e)
             await db.commit()
-        except:
-            pass
+            dashboard_cache.invalidate(organization_id)
+            documents_cache.invalidate(organization_id)
+            logger.info(f"Document analysis completed for {filename}")
+            
+            # If admin uploaded a compliance document, extract requirements for
+            # ComplianceRequirement table. Runs after the analysis has been
+            # committed, since a failed extraction rolls the session back.
+            if is_admin and document.document_type in REQUIREMENT_SOURCE_TYPES:
+                await extract_compliance_requirements_from_admin_document(
+                    db, document, extracted_text, organization_id, jurisdictions
+                )
+        
+        except Exception as e:
+            logger.error(f"Document analysis failed for {filename}: {e}")
+            # Mark analysis as failed
+            try:
+                analysis.status = AnalysisStatus.FAILED
+                analysis.error_message = str(e)
+                await db.commit()
+                documents_cache.invalidate(organization_id)
+            except:
+                pass
 
 
 @router.get("/")
 async def list_documents(
+    request: Request,
+    cursor: Optional[UUID] = Query(None, description="Id of the last document of the previous page (the X-Next-Cursor header)"),
+    limit: int = Query(DOCUMENT_PAGE_SIZE, ge=1, le=200),
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_user_organization),
     db: AsyncSession = Depends(get_db)
 ):
-    """List all documents for current user's organization"""
+    """
+    List documents for current user's organization, newest first, a page at
+    a time. Without parameters only the newest 50 documents are returned.
+    When there may be more, the X-Next-Cursor response header carries the
+    cursor for the next page; its absence means this is the last page.
+    """
+    
+    if cursor is not None or limit != DOCUMENT_PAGE_SIZE:
+        documents_data = await _build_document_list(db, organization.id, limit, cursor)
+        return ORJSONResponse(documents_data, headers=_next_cursor_headers(documents_data, limit))
+    
+    # Serve the cached first page when there is one; otherwise rebuild it,
+    # once per organization even when several requests miss together
+    snapshot = documents_cache.get(organization.id)
+    if not snapshot:
+        async with documents_cache.lock(organization.id):
+            snapshot = documents_cache.get(organization.id)
+            if not snapshot:
+                generation = documents_cache.generation(organization.id)
+                documents_data = await _build_document_list(db, organization.id, limit)
+                snapshot = documents_cache.set(
+                    organization.id, documents_data, generation,
+                    headers=_next_cursor_headers(documents_data, limit)
+                )
     
-    result = await db.execute(
-        select(Document, DocumentAnalysis).outerjoin(DocumentAnalysis).where(
-            Document.organization_id == organization.id
-        ).order_by(Document.upload_date.desc())
+    body, etag, page_headers = snapshot
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", **page_headers}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _next_cursor_headers(documents_data: List[dict], limit: int) -> dict:
+    """X-Next-Cursor for a full page: the id of its last document"""
+    if len(documents_data) == limit:
+        return {"X-Next-Cursor": documents_data[-1]["id"]}
+    return {}
+
+
+async def _build_document_list(
+    db: AsyncSession,
+    organization_id: UUID,
+    limit: int,
+    cursor: Optional[UUID] = None
+) -> List[dict]:
+    """
+    A page of an organization's documents with their latest analysis, newest
+    first. Keyset pagination on (upload_date, id): the page starts after the
+    cursor document, so deep pages cost the same as the first.
+    """
+    
+    conditions = [Document.organization_id == organization_id]
+    if cursor is not None:
+        anchor = (await db.execute(
+            select(Document.upload_date, Document.id).where(
+                and_(
+                    Document.id == cursor,
+                    Document.organization_id == organization_id
+                )
+            )
+        )).first()
+        if not anchor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        conditions.append(
+            tuple_(Document.upload_date, Document.id) < tuple_(anchor.upload_date, anchor.id)
+        )
+    
+    # The page itself, so analyses are only looked up for its documents
+    page_subquery = (
+        select(Document.id)
+        .where(and_(*conditions))
+        .order_by(Document.upload_date.desc(), Document.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    
+    # Latest analysis per document, so each document comes back once even
+    # when it has been analyzed more than once
+    latest_subquery = (
+        select(DocumentAnalysis)
+        .where(DocumentAnalysis.document_id.in_(select(page_subquery.c.id)))
+        .distinct(DocumentAnalysis.document_id)
+        .order_by(DocumentAnalysis.document_id, DocumentAnalysis.created_at.desc())
+        .subquery()
+    )
+    latest_analysis = aliased(DocumentAnalysis, latest_subquery)
+    
+    # Server-side cursor, so analysis results (full LLM output) are pulled
+    # in batches rather than buffered all at once
+    result = await db.stream(
+        select(Document, latest_analysis)
+        .join(page_subquery, page_subquery.c.id == Document.id)
+        .outerjoin(latest_analysis, latest_analysis.document_id == Document.id)
+        .order_by(Document.upload_date.desc(), Document.id.desc())
+        .execution_options(yield_per=DOCUMENT_LIST_BATCH_SIZE)
     )
     
     documents_data = []
-    for document, analysis in result:
+    async for document, analysis in result:
         doc_data = {
             "id": str(document.id),
             "filename": document.filename,
             "document_type": document.document_type.value,
-            "upload_date": document.upload_date.isoformat(),
+            "upload_date": document.upload_date,
             "description": document.description,
             "uploaded_by": str(document.uploaded_by),
             "status": "processed" if analysis and analysis.status == AnalysisStatus.COMPLETED else "processing"
@@ -230,7 +377,7 @@ async def list_documents(
             doc_data.update({
                 "analysis_status": analysis.status.value,
                 "analysis_result": analysis.result if analysis.status == AnalysisStatus.COMPLETED else None,
-                "analysis_completed": analysis.completed_at.isoformat() if analysis.completed_at else None
+                "analysis_completed": analysis.completed_at
             })
         
         documents_data.append(doc_data)
@@ -286,6 +433,40 @@ async def get_document(
     return doc_data
 
 
+@router.get("/{document_id}/download")
+async def download_document(
+    document_id: UUID,
+    current_user: User = Depends(get_current_user),
+    organization: Organization = Depends(get_user_organization),
+    db: AsyncSession = Depends(get_db)
+):
+    """Download the original uploaded file"""
+    
+    result = await db.execute(
+        select(Document.filename, Document.file_path, Document.mime_type).where(
+            and_(
+                Document.id == document_id,
+                Document.organization_id == organization.id
+            )
+        )
+    )
+    document = result.first()
+    
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    if not await aiofiles.os.path.isfile(document.file_path):
+        raise HTTPException(status_code=404, detail="Document file not found")
+    
+    # Served from disk by the server (sendfile where available) rather
+    # than read into memory here
+    return FileResponse(
+        document.file_path,
+        media_type=document.mime_type,
+        filename=document.filename
+    )
+
+
 @router.delete("/{document_id}")
 async def delete_document(
     document_id: UUID,
@@ -309,15 +490,13 @@ async def delete_document(
         raise HTTPException(status_code=404, detail="Document not found")
     
     # Delete file from storage
-    try:
-        if os.path.exists(document.file_path):
-            os.remove(document.file_path)
-    except Exception as e:
-        logger.warning(f"Failed to delete file {document.file_path}: {e}")
+    await document_processor.remove_file(document.file_path)
     
     # Delete database record (cascade will delete analysis)
     await db.delete(document)
     await db.commit()
+    dashboard_cache.invalidate(organization.id)
+    documents_cache.invalidate(organization.id)
     
     return {"message": "Document deleted successfully"}
 
@@ -332,12 +511,7 @@ async def analyze_form_responses(
     """Analyze intelligent form responses for compliance"""
     
     # Get organization's jurisdictions
-    result = await db.execute(
-        select(Jurisdiction).join(Jurisdiction.organizations).where(
-            Jurisdiction.organizations.any(organization_id=organization.id)
-        )
-    )
-    jurisdictions = result.scalars().all()
+    jurisdictions = await _get_organization_jurisdictions(db, organization.id)
     
     if not jurisdictions:
         logger.warning("No jurisdictions found. Please upload compliance documents to create jurisdictions.")
@@ -354,8 +528,7 @@ async def analyze_form_responses(
     # Combine all compliance requirements
     all_rules = []
     for jurisdiction in jurisdictions:
-        if jurisdiction.compliance_requirements:
-            all_rules.extend(jurisdiction.compliance_requirements)
+        all_rules.extend(jurisdiction.requirements)
     
     # Perform AI analysis on form responses
     analysis_result = await openai_service.analyze_form_responses(
@@ -399,104 +572,93 @@ async def analyze_form_responses(
     }
 
 
+async def _get_organization_jurisdictions(db: AsyncSession, organization_id: UUID) -> List[Jurisdiction]:
+    """Jurisdictions an organization is set up for, with their requirements loaded"""
+    
+    result = await db.execute(
+        select(Jurisdiction)
+        .join(OrganizationJurisdiction, OrganizationJurisdiction.jurisdiction_id == Jurisdiction.id)
+        .where(OrganizationJurisdiction.organization_id == organization_id)
+        .options(selectinload(Jurisdiction.requirements))
+    )
+    return list(result.scalars().unique())
+
+
 async def extract_compliance_requirements_from_admin_document(
     db: AsyncSession,
     document: Document,
     extracted_text: str,
-    organization_id: UUID
+    organization_id: UUID,
+    jurisdictions: List[Jurisdiction]
 ):
     """Extract compliance requirements from admin-uploaded documents and populate ComplianceRequirement table"""
     try:
         logger.info(f"Extracting compliance requirements from admin document: {document.filename}")
 
-        # Get organization's jurisdictions to determine which framework to extract for
-        jurisdictions_result = await db.execute(
-            select(Jurisdiction).join(Jurisdiction.organizations).where(
-                Jurisdiction.organizations.any(organization_id=organization_id)
-            )
-        )
-        jurisdictions = jurisdictions_result.scalars().all()
+        # The organization's jurisdictions determine which framework to extract for
 
         if not jurisdictions:
             logger.warning(f"No jurisdictions found for organization {organization_id}")
             return
 
-        # Use OpenAI to extract structured compliance requirements
-        requirements_prompt = f"""
-        Extract compliance requirements from this document: {document.filename}
-
-        Document content:
-        {extracted_text[:8000]}  # Limit to avoid token limits
-
-        Please extract specific, actionable compliance requirements and return them as a JSON array with this structure:
-        [
-            {{
-                "requirement_id": "unique_id",
-                "title": "Requirement title",
-                "description": "Detailed requirement description",
-                "category": "Category (e.g., Risk Management, Data Protection, etc.)",
-                "criticality": "high|medium|low",
-                "regulation_type": "eu_ai_act|us_ai_governance|iso_42001"
-            }}
-        ]
-
-        Focus on extracting concrete, measurable requirements that organizations need to implement.
-        Categorize by regulation type based on document content.
-        """
-
+        # Use OpenAI to extract structured compliance requirements from the
+        # whole document, chunked on section boundaries
         extracted_requirements = await openai_service.extract_compliance_requirements(
-            requirements_prompt, extracted_text
+            document.filename, extracted_text
         )
 
         if not extracted_requirements:
             logger.warning(f"No requirements extracted from {document.filename}")
             return
 
-        # Store extracted requirements in ComplianceRequirement table
-        requirements_created = 0
-        for req_data in extracted_requirements:
-            try:
-                # Find matching jurisdiction based on regulation_type
-                target_jurisdiction = None
-                for jurisdiction in jurisdictions:
-                    if jurisdiction.regulation_type.value == req_data.get('regulation_type'):
-                        target_jurisdiction = jurisdiction
-                        break
-
-                if not target_jurisdiction and jurisdictions:
-                    # Fallback to first jurisdiction if no exact match
-                    target_jurisdiction = jurisdictions[0]
-
-                if target_jurisdiction:
-                    # Check if requirement already exists
-                    existing_req = await db.execute(
-                        select(ComplianceRequirement).where(
-                            and_(
-                                ComplianceRequirement.jurisdiction_id == target_jurisdiction.id,
-                                ComplianceRequirement.requirement_id == req_data.get('requirement_id')
-                            )
-                        )
-                    )
+        # Index jurisdictions by regulation type once instead of scanning per requirement
+        jurisdictions_by_type = {}
+        for jurisdiction in jurisdictions:
+            jurisdictions_by_type.setdefault(jurisdiction.regulation_type.value, jurisdiction)
+
+        # Requirement ids that already exist for these jurisdictions, fetched
+        # once rather than checked per extracted requirement
+        existing_result = await db.execute(
+            select(ComplianceRequirement.jurisdiction_id, ComplianceRequirement.requirement_id).where(
+                ComplianceRequirement.jurisdiction_id.in_([j.id for j in jurisdictions])
+            )
+        )
+        existing_keys = {(jurisdiction_id, requirement_id) for jurisdiction_id, requirement_id in existing_result}
 
-                    if not existing_req.scalar_one_or_none():
-                        new_requirement = ComplianceRequirement(
-                            jurisdiction_id=target_jurisdiction.id,
-                            requirement_id=req_data.get('requirement_id'),
-                            title=req_data.get('title'),
-                            description=req_data.get('description'),
-                            category=req_data.get('category', 'General'),
-                            criticality=req_data.get('criticality', 'medium'),
-                            is_active=True,
-                            source_document=document.filename,
-                            created_at=datetime.utcnow()
-                        )
-                        db.add(new_requirement)
-                        requirements_created += 1
-
-            except Exception as req_error:
-                logger.error(f"Error creating requirement: {req_error}")
+        # Collect new requirements for a single multi-row INSERT
+        requirement_rows = []
+        for req_data in extracted_requirements:
+            # Skip entries missing the fields the table requires
+            if not (req_data.get('requirement_id') and req_data.get('title') and req_data.get('description')):
                 continue
 
+            # Find matching jurisdiction based on regulation_type,
+            # falling back to first jurisdiction if no exact match
+            target_jurisdiction = jurisdictions_by_type.get(
+                req_data.get('regulation_type'), jurisdictions[0]
+            )
+
+            key = (target_jurisdiction.id, req_data['requirement_id'])
+            if key not in existing_keys:
+                # Remember queued rows too, so a requirement repeated in the
+                # extraction is only inserted once
+                existing_keys.add(key)
+                requirement_rows.append({
+                    "jurisdiction_id": target_jurisdiction.id,
+                    "requirement_id": req_data['requirement_id'],
+                    "title": req_data['title'],
+                    "description": req_data['description'],
+                    "category": req_data.get('category', 'General'),
+                    "criticality": req_data.get('criticality', 'medium'),
+                    "is_active": True,
+                    "created_at": datetime.utcnow()
+                })
+
+        # Store extracted requirements in ComplianceRequirement table
+        if requirement_rows:
+            await db.execute(insert(ComplianceRequirement), requirement_rows)
+        requirements_created = len(requirement_rows)
+
         await db.commit()
         logger.info(f"Successfully created {requirements_created} compliance requirements from {document.filename}")
 
@@ -524,40 +686,47 @@ async def generate_tasks_from_requirements(
         )
         requirements = requirements_result.scalars().all()
 
-        tasks_created = 0
-        for requirement in requirements:
-            # Check if task already exists for this requirement
-            existing_task = await db.execute(
-                select(ComplianceTask).where(
-                    and_(
-                        ComplianceTask.organization_id == organization_id,
-                        ComplianceTask.jurisdiction_id == jurisdiction.id,
-                        ComplianceTask.title.ilike(f"%{requirement.title[:20]}%")
-                    )
+        # Titles of the jurisdiction's existing tasks, fetched once rather
+        # than searched per requirement
+        existing_titles_result = await db.execute(
+            select(ComplianceTask.title).where(
+                and_(
+                    ComplianceTask.organization_id == organization_id,
+                    ComplianceTask.jurisdiction_id == jurisdiction.id
                 )
             )
+        )
+        existing_titles = [title.lower() for title in existing_titles_result.scalars()]
 
-            if not existing_task.scalar_one_or_none():
+        # Collect new tasks for a single multi-row INSERT
+        task_rows = []
+        for requirement in requirements:
+            # Check if task already exists for this requirement
+            title_prefix = requirement.title[:20].lower()
+            if not any(title_prefix in title for title in existing_titles):
                 # Determine priority from criticality
                 priority = TaskPriority.HIGH if requirement.criticality == 'high' else \
                           TaskPriority.MEDIUM if requirement.criticality == 'medium' else \
                           TaskPriority.LOW
 
-                # Create task
-                task = ComplianceTask(
-                    organization_id=organization_id,
-                    jurisdiction_id=jurisdiction.id,
-                    title=requirement.title,
-                    description=requirement.description,
-                    priority=priority,
-                    status=TaskStatus.TODO,
-                    due_date=datetime.utcnow() + timedelta(days=30),  # Default 30 days
-                    created_at=datetime.utcnow()
-                )
-                db.add(task)
-                tasks_created += 1
+                task_rows.append({
+                    "organization_id": organization_id,
+                    "jurisdiction_id": jurisdiction.id,
+                    "title": requirement.title,
+                    "description": requirement.description,
+                    "priority": priority,
+                    "status": TaskStatus.TODO,
+                    "due_date": datetime.utcnow() + timedelta(days=30),  # Default 30 days
+                    "created_at": datetime.utcnow()
+                })
+
+        # Create tasks
+        if task_rows:
+            await db.execute(insert(ComplianceTask), task_rows)
+        tasks_created = len(task_rows)
 
         await db.commit()
+        dashboard_cache.invalidate(organization_id)
         logger.info(f"Successfully created {tasks_created} tasks from compliance requirements")
 
     except Exception as e:
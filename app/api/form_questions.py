@@ -2,12 +2,13 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 from app.database import get_db
 from app.api.deps import get_current_user, get_user_organization
 from app.models.user import User
 from app.models.organization import Organization
 from app.models.form_question import FormQuestion, FormResponse
+from app.models.jurisdiction import Jurisdiction, OrganizationJurisdiction
 from app.schemas.form_question import (
     FormQuestionResponse, FormQuestionCreate, FormQuestionUpdate,
     FormResponseCreate, FormResponseDetail, FormSubmission,
@@ -139,23 +140,25 @@ async def submit_form_responses(
     """Submit form responses"""
     responses = []
     
-    for response_data in submission.responses:
-        # Check if response already exists
-        existing_result = await db.execute(
-            select(FormResponse).where(
-                and_(
-                    FormResponse.organization_id == current_org.id,
-                    FormResponse.question_id == response_data.question_id
-                )
+    # Existing responses for all submitted questions, fetched once rather
+    # than checked per question
+    existing_result = await db.execute(
+        select(FormResponse).where(
+            and_(
+                FormResponse.organization_id == current_org.id,
+                FormResponse.question_id.in_([r.question_id for r in submission.responses])
             )
         )
-        existing_response = existing_result.scalar_one_or_none()
+    )
+    existing_responses = {r.question_id: r for r in existing_result.scalars()}
+    
+    for response_data in submission.responses:
+        existing_response = existing_responses.get(response_data.question_id)
         
         if existing_response:
             # Update existing response
             existing_response.answer = response_data.answer
             existing_response.user_id = current_user.id
-            await db.flush()
             responses.append(existing_response)
         else:
             # Create new response
@@ -166,9 +169,10 @@ async def submit_form_responses(
                 answer=response_data.answer
             )
             db.add(new_response)
-            await db.flush()
+            existing_responses[response_data.question_id] = new_response
             responses.append(new_response)
     
+    await db.flush()
     await db.commit()
     
     # Fetch responses with question details
@@ -181,15 +185,12 @@ async def submit_form_responses(
     
     # Trigger AI analysis of form responses
     try:
-        # Get all jurisdiction rules for analysis
-        from app.models.jurisdiction import Jurisdiction
-        from app.models.organization import OrganizationJurisdiction
-        
-        # Get organization's jurisdictions
+        # Get organization's jurisdictions with their requirements in one go
         jurisdictions_result = await db.execute(
             select(Jurisdiction)
             .join(OrganizationJurisdiction)
             .where(OrganizationJurisdiction.organization_id == current_org.id)
+            .options(selectinload(Jurisdiction.requirements))
         )
         jurisdictions = jurisdictions_result.scalars().all()
         
@@ -203,8 +204,7 @@ async def submit_form_responses(
             # Get all rules from active jurisdictions
             all_rules = []
             for jurisdiction in jurisdictions:
-                if hasattr(jurisdiction, 'rules') and jurisdiction.rules:
-                    all_rules.extend(jurisdiction.rules)
+                all_rules.extend(jurisdiction.requirements)
             
             # Perform AI analysis
             await openai_service.analyze_form_responses(form_responses, all_rules)
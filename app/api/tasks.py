@@ -8,6 +8,7 @@ from app.models.user import User
 from app.models.organization import Organization
 from app.models.compliance import ComplianceTask, TaskStatus, TaskPriority
 from app.models.jurisdiction import Jurisdiction
+from app.services.snapshot_cache import dashboard_cache
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta
@@ -151,6 +152,7 @@ async def create_task(
     await db.flush()
     await db.refresh(task)
     await db.commit()
+    dashboard_cache.invalidate(organization.id)
     
     return {
         "id": str(task.id),
@@ -269,6 +271,7 @@ async def update_task(
             ).values(**update_fields)
         )
         await db.commit()
+        dashboard_cache.invalidate(organization.id)
     
     return {"message": "Task updated successfully"}
 
@@ -296,6 +299,7 @@ async def delete_task(
     
     await db.delete(task)
     await db.commit()
+    dashboard_cache.invalidate(organization.id)
     
     return {"message": "Task deleted successfully"}
 
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 3600  # seconds
     
     # Security
     SECRET_KEY: str = secrets.token_urlsafe(32)
@@ -45,6 +48,7 @@ class Settings(BaseSettings):
     # File Upload
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    TEXT_EXTRACTION_WORKERS: Optional[int] = None  # Worker processes for PDF/DOCX parsing; None = CPU count
     
     class Config:
         env_file = ".env"
@@ -1,6 +1,7 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from fastapi.concurrency import run_in_threadpool
 from app.models.user import User
 from app.core.security import verify_password, get_password_hash
 import uuid
@@ -14,7 +15,8 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> Opti
     if not user or not user.hashed_password:
         return None
     
-    if not verify_password(password, user.hashed_password):
+    # bcrypt is deliberately slow; keep it off the event loop
+    if not await run_in_threadpool(verify_password, password, user.hashed_password):
         return None
     
     return user
@@ -41,29 +43,24 @@ async def create_user(
     plan: str = "basic"
 ) -> User:
     """Create new user"""
-    print(f"DEBUG create_user: Starting user creation for {email}")
     
     from app.models.user import PlanType
     plan_enum = PlanType.BASIC if plan == "basic" else PlanType.PROFESSIONAL
     
+    hashed_password = await run_in_threadpool(get_password_hash, password) if password else None
+    
     user = User(
         email=email,
-        hashed_password=get_password_hash(password) if password else None,
+        hashed_password=hashed_password,
         full_name=full_name,
         is_verified=is_verified,
         is_active=True,
         plan=plan_enum
     )
-    print(f"DEBUG create_user: User object created: {user.email} with plan: {plan}")
     
     db.add(user)
-    print(f"DEBUG create_user: User added to session")
-    
     await db.flush()
-    print(f"DEBUG create_user: Session flushed")
-    
     await db.refresh(user)
-    print(f"DEBUG create_user: User refreshed, ID: {user.id}")
     
     return user
 
@@ -72,7 +69,7 @@ async def create_user(
 
 async def update_user_password(db: AsyncSession, user: User, new_password: str) -> User:
     """Update user password"""
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await run_in_threadpool(get_password_hash, new_password)
     await db.flush()
     await db.refresh(user)
     return user
\ No newline at end of file
@@ -4,6 +4,10 @@ from app.config import settings
 import httpx
 
 
+class GoogleAuthError(Exception):
+    """Raised when Google rejects or fails the OAuth exchange"""
+
+
 class GoogleAuth:
     """Google OAuth 2.0 authentication handler"""
     
@@ -15,16 +19,38 @@ class GoogleAuth:
         self.client_id = settings.GOOGLE_CLIENT_ID
         self.client_secret = settings.GOOGLE_CLIENT_SECRET
         self.redirect_uri = settings.GOOGLE_REDIRECT_URI
+        self._oauth_client: Optional[AsyncOAuth2Client] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def oauth_client(self) -> AsyncOAuth2Client:
+        """OAuth client used to build authorization URLs, created once"""
+        if self._oauth_client is None:
+            self._oauth_client = AsyncOAuth2Client(
+                client_id=self.client_id,
+                redirect_uri=self.redirect_uri,
+                scope="openid email profile"
+            )
+        return self._oauth_client
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, so connections to Google are reused across logins"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient()
+        return self._http_client
+    
+    async def close(self):
+        """Close the shared clients"""
+        for client in (self._oauth_client, self._http_client):
+            if client is not None:
+                await client.aclose()
+        self._oauth_client = None
+        self._http_client = None
     
     def get_auth_url(self, state: Optional[str] = None) -> str:
         """Get Google OAuth authorization URL"""
-        client = AsyncOAuth2Client(
-            client_id=self.client_id,
-            redirect_uri=self.redirect_uri,
-            scope="openid email profile"
-        )
-        
-        authorization_url, _ = client.create_authorization_url(
+        authorization_url, _ = self.oauth_client.create_authorization_url(
             self.GOOGLE_AUTH_URL,
             state=state,
             access_type="offline",
@@ -35,35 +61,33 @@ class GoogleAuth:
     
     async def get_token(self, code: str) -> Dict[str, Any]:
         """Exchange authorization code for access token"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.GOOGLE_TOKEN_URL,
-                data={
-                    "code": code,
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "redirect_uri": self.redirect_uri,
-                    "grant_type": "authorization_code"
-                }
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Failed to get token: {response.text}")
-            
-            return response.json()
+        response = await self.http_client.post(
+            self.GOOGLE_TOKEN_URL,
+            data={
+                "code": code,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "redirect_uri": self.redirect_uri,
+                "grant_type": "authorization_code"
+            }
+        )
+        
+        if response.status_code != 200:
+            raise GoogleAuthError(f"Failed to get token: {response.text}")
+        
+        return response.json()
     
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Get user info from Google"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.GOOGLE_USER_INFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Failed to get user info: {response.text}")
-            
-            return response.json()
+        response = await self.http_client.get(
+            self.GOOGLE_USER_INFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        
+        if response.status_code != 200:
+            raise GoogleAuthError(f"Failed to get user info: {response.text}")
+        
+        return response.json()
     
     async def authenticate(self, code: str) -> Dict[str, Any]:
         """Complete OAuth flow and return user info"""
@@ -72,7 +96,7 @@ class GoogleAuth:
         access_token = token_data.get("access_token")
         
         if not access_token:
-            raise Exception("No access token received")
+            raise GoogleAuthError("No access token received")
         
         # Get user info
         user_info = await self.get_user_info(access_token)
@@ -12,7 +12,13 @@ if database_url.startswith("postgresql://"):
 engine = create_async_engine(
     database_url,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Short OLTP queries only; JIT compilation costs more than it saves
+    connect_args={"server_settings": {"jit": "off"}}
 )
 
 # Create async session factory
@@ -1,9 +1,28 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.database import init_db
+from sqlalchemy import select
+from app.database import init_db, AsyncSessionLocal
+from app.core.google_auth import google_auth
+from app.services.document_processor import shutdown_extraction_pool
+from app.models.jurisdiction import Jurisdiction
 from app.api import auth, users, compliance, documents, dashboard, jurisdictions, tasks, reports, organizations, form_questions, admin
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def check_jurisdictions():
+    """Warn once at startup if there are no jurisdictions yet (no automatic seeding)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            has_jurisdictions = await db.scalar(select(select(Jurisdiction.id).exists()))
+            if not has_jurisdictions:
+                logger.warning("No jurisdictions found. Upload compliance documents to create jurisdictions.")
+    except Exception as e:
+        logger.warning(f"Jurisdiction check skipped: {e}")
 
 
 @asynccontextmanager
@@ -11,9 +30,12 @@ async def lifespan(app: FastAPI):
     # Startup
     print("Starting up...")
     # await init_db()  # Commented out since we use Alembic migrations
+    await check_jurisdictions()
     yield
     # Shutdown
     print("Shutting down...")
+    await google_auth.close()
+    shutdown_extraction_pool()
 
 
 app = FastAPI(
@@ -35,8 +57,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Document listing pagination
 )
 
+# Compress JSON responses (document listings carry full analysis results);
+# small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text, Boolean, Integer, Float, UUID as SQLAlchemyUUID, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text, Boolean, Integer, Float, Index, UUID as SQLAlchemyUUID, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -46,12 +46,12 @@ class ComplianceTask(Base):
     
     id = Column(SQLAlchemyUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    jurisdiction_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("jurisdictions.id", ondelete="SET NULL"), nullable=True)
+    jurisdiction_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("jurisdictions.id", ondelete="SET NULL"), nullable=True, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False)
     priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
-    assignee_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    assignee_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     due_date = Column(DateTime, nullable=True)
     completed_date = Column(DateTime, nullable=True)
     
@@ -68,12 +68,17 @@ class ComplianceTask(Base):
     jurisdiction = relationship("Jurisdiction", back_populates="compliance_tasks")
     assignee = relationship("User", back_populates="assigned_tasks")
 
+    __table_args__ = (
+        Index("ix_compliance_tasks_org_status", "organization_id", "status"),
+        Index("ix_compliance_tasks_org_jurisdiction", "organization_id", "jurisdiction_id"),
+    )
+
 
 class ComplianceReport(Base):
     __tablename__ = "compliance_reports"
     
     id = Column(SQLAlchemyUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     report_type = Column(Enum(ReportType), nullable=False)  # Only 'dashboard' or 'audit_report'
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
@@ -90,10 +95,11 @@ class ComplianceDocument(Base):
     __tablename__ = "compliance_documents"
     
     id = Column(SQLAlchemyUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    jurisdiction_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("jurisdictions.id", ondelete="CASCADE"), nullable=False)
+    jurisdiction_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("jurisdictions.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     document_type = Column(String(50), nullable=False)  # 'official_text', 'guidance', 'implementation'
     file_path = Column(String(500), nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of file content, for dedupe
     version = Column(String(50), nullable=True)
     effective_date = Column(DateTime, nullable=True)
     uploaded_by = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -133,6 +139,11 @@ class ComplianceRequirement(Base):
     source_document = relationship("ComplianceDocument", back_populates="requirements")
     assessments = relationship("ComplianceAssessment", back_populates="requirement", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_compliance_requirements_source_document_requirement", "source_document_id", "requirement_id"),
+        Index("ix_compliance_requirements_jurisdiction_requirement", "jurisdiction_id", "requirement_id"),
+    )
+
 
 class AssessmentSession(Base):
     """Track assessment sessions for audit purposes"""
@@ -149,6 +160,7 @@ class AssessmentSession(Base):
     partial_count = Column(Integer, nullable=False, default=0)
     non_compliant_count = Column(Integer, nullable=False, default=0)
     not_addressed_count = Column(Integer, nullable=False, default=0)
+    processing_status = Column(String(20), nullable=False, default='completed', server_default='completed')  # 'processing', 'completed', 'failed'
     created_by = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
@@ -158,15 +170,19 @@ class AssessmentSession(Base):
     assessments = relationship("ComplianceAssessment", back_populates="session", cascade="all, delete-orphan")
     creator = relationship("User")
 
+    __table_args__ = (
+        Index("ix_assessment_sessions_org_created", "organization_id", created_at.desc()),
+    )
+
 
 class ComplianceAssessment(Base):
     """Tracks compliance status for each requirement per organization"""
     __tablename__ = "compliance_assessments"
     
     id = Column(SQLAlchemyUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    session_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("assessment_sessions.id", ondelete="CASCADE"), nullable=True)  # Can be null for legacy data
+    session_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("assessment_sessions.id", ondelete="CASCADE"), nullable=True, index=True)  # Can be null for legacy data
     organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    requirement_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("compliance_requirements.id", ondelete="CASCADE"), nullable=False)
+    requirement_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("compliance_requirements.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(String(20), nullable=False)  # 'COMPLIANT', 'PARTIAL', 'NON_COMPLIANT', 'NOT_ASSESSED'
     evidence_text = Column(Text, nullable=True)  # Actual evidence quote from document/response
     evidence_type = Column(String(50), nullable=True)  # 'document', 'form_response'
@@ -182,4 +198,8 @@ class ComplianceAssessment(Base):
     # Relationships
     session = relationship("AssessmentSession", back_populates="assessments")
     organization = relationship("Organization", back_populates="compliance_assessments")
-    requirement = relationship("ComplianceRequirement", back_populates="assessments")
\ No newline at end of file
+    requirement = relationship("ComplianceRequirement", back_populates="assessments")
+
+    __table_args__ = (
+        Index("ix_compliance_assessments_org_requirement", "organization_id", "requirement_id"),
+    )
\ No newline at end of file
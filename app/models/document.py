@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text, Integer, UUID as SQLAlchemyUUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Text, Integer, Index, UUID as SQLAlchemyUUID
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -32,6 +32,9 @@ class Document(Base):
     organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)  # S3 URL or local path
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of file content, for dedupe
+    file_size = Column(Integer, nullable=True)  # Bytes, counted while streaming the upload
+    mime_type = Column(String(100), nullable=True)
     document_type = Column(Enum(DocumentType), nullable=False, default=DocumentType.OTHER)
     description = Column(Text, nullable=True)
     uploaded_by = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
@@ -42,6 +45,10 @@ class Document(Base):
     uploader = relationship("User", back_populates="uploaded_documents")
     analyses = relationship("DocumentAnalysis", back_populates="document", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_documents_org_upload_date", "organization_id", upload_date.desc()),
+    )
+
 
 class DocumentAnalysis(Base):
     __tablename__ = "document_analyses"
@@ -61,4 +68,8 @@ class DocumentAnalysis(Base):
     
     # Relationships
     document = relationship("Document", back_populates="analyses")
-    jurisdiction = relationship("Jurisdiction")
\ No newline at end of file
+    jurisdiction = relationship("Jurisdiction")
+
+    __table_args__ = (
+        Index("ix_document_analyses_document_status_completed", "document_id", "status", completed_at.desc()),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, UUID as SQLAlchemyUUID
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Enum, Integer, Index, UUID as SQLAlchemyUUID
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -39,8 +39,8 @@ class FormResponse(Base):
     
     id = Column(SQLAlchemyUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    question_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("form_questions.id"), nullable=False)
+    user_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    question_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("form_questions.id"), nullable=False, index=True)
     answer = Column(Text, nullable=True)
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -49,4 +49,8 @@ class FormResponse(Base):
     # Relationships
     question = relationship("FormQuestion")
     user = relationship("User", foreign_keys=[user_id])
-    organization = relationship("Organization")
\ No newline at end of file
+    organization = relationship("Organization")
+
+    __table_args__ = (
+        Index("ix_form_responses_org_user", "organization_id", "user_id"),
+    )
\ No newline at end of file
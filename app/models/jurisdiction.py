@@ -54,8 +54,8 @@ class OrganizationJurisdiction(Base):
     __tablename__ = "organization_jurisdictions"
     
     id = Column(SQLAlchemyUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    jurisdiction_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("jurisdictions.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
+    jurisdiction_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("jurisdictions.id", ondelete="CASCADE"), nullable=False, index=True)
     compliance_status = Column(Enum(ComplianceStatus), default=ComplianceStatus.NOT_STARTED, nullable=False)
     compliance_score = Column(Float, nullable=True)  # 0.0 to 100.0
     setup_date = Column(DateTime, default=datetime.utcnow)
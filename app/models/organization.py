@@ -46,7 +46,7 @@ class UserOrganization(Base):
     __tablename__ = "user_organizations"
     
     user_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
-    organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True)
+    organization_id = Column(SQLAlchemyUUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True, index=True)
     role = Column(Enum(UserRole), nullable=False, default=UserRole.MEMBER)
     joined_at = Column(DateTime, default=datetime.utcnow)
     
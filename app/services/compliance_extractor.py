@@ -98,7 +98,7 @@ class ComplianceExtractor:
                 logger.info(f"📄 USING CHUNKING METHOD for {framework} extraction")
                 extraction_metadata["method"] = "chunking"
 
-                document_text, _ = document_processor.extract_text_from_file(file_path, file_path)
+                document_text, _ = await document_processor.extract_text(file_path, file_path)
                 extraction_metadata["extracted_text"] = document_text
                 extraction_metadata["text_length"] = len(document_text)
 
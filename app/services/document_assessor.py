@@ -28,26 +28,31 @@ class DocumentAssessor:
         document_path: str,
         document_name: str,
         db: AsyncSession,
-        created_by: UUID
+        created_by: UUID,
+        session_id: Optional[UUID] = None
     ) -> Dict[str, Any]:
         """
         Assess a company document against all applicable compliance requirements
+        Results are recorded on the given assessment session, or a new one
         """
         
         try:
-            # Create assessment session
-            session = AssessmentSession(
-                organization_id=organization_id,
-                session_type="document_upload",
-                source_document_name=document_name,
-                source_document_path=document_path,
-                created_by=created_by
-            )
-            db.add(session)
-            await db.flush()
+            if session_id:
+                session = await db.get(AssessmentSession, session_id)
+            else:
+                # Create assessment session
+                session = AssessmentSession(
+                    organization_id=organization_id,
+                    session_type="document_upload",
+                    source_document_name=document_name,
+                    source_document_path=document_path,
+                    created_by=created_by
+                )
+                db.add(session)
+                await db.flush()
             
             # Extract text from company document
-            company_text, file_type = document_processor.extract_text_from_file(document_path, document_name)
+            company_text, file_type = await document_processor.extract_text(document_path, document_name)
             
             if file_type == 'error':
                 raise Exception(f"Failed to extract text from {document_name}")
@@ -113,6 +118,7 @@ class DocumentAssessor:
             session.non_compliant_count = overall_stats['non_compliant']
             session.not_addressed_count = overall_stats['not_addressed']
             session.overall_score = overall_stats['score']
+            session.processing_status = 'completed'
             session.completed_at = datetime.utcnow()
             
             await db.commit()
@@ -1,10 +1,17 @@
 """Document processing service for extracting text from various file formats"""
 
 import os
+import asyncio
+import hashlib
+import multiprocessing
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import logging
+import aiofiles
+import aiofiles.os
 
 try:
     import docx
@@ -15,6 +22,40 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+# PDF/DOCX parsing is pure-Python CPU work, so it runs in worker processes
+# rather than on the event loop; created on first use
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+
+class FileTooLargeError(ValueError):
+    """Raised when an upload exceeds the allowed size"""
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    global _extraction_pool
+    if _extraction_pool is None:
+        from app.config import settings
+        # Spawned rather than forked: the app process already runs threads
+        # (threadpool, database driver) and forking those can deadlock
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=settings.TEXT_EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stop the extraction worker processes (called on app shutdown)"""
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(cancel_futures=True)
+        _extraction_pool = None
+
+
 class DocumentProcessor:
     
     @staticmethod
@@ -40,6 +81,29 @@ class DocumentProcessor:
             logger.error(f"Failed to extract text from {filename}: {e}")
             return f"Error extracting text from {filename}: {str(e)}", 'error'
     
+    @staticmethod
+    async def extract_text(file_path: str, filename: str) -> Tuple[str, str]:
+        """
+        extract_text_from_file in a worker process, so parsing doesn't block
+        the event loop
+        Returns: (extracted_text, file_type)
+        """
+        global _extraction_pool
+        loop = asyncio.get_running_loop()
+        pool = _get_extraction_pool()
+        try:
+            return await loop.run_in_executor(
+                pool, DocumentProcessor.extract_text_from_file, file_path, filename
+            )
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory on a hostile PDF); the pool
+            # stays unusable, so replace it for later extractions
+            logger.error(f"Text extraction worker died while processing {filename}: {e}")
+            if _extraction_pool is pool:
+                _extraction_pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+            return f"Error extracting text from {filename}: {str(e)}", 'error'
+    
     @staticmethod
     def _extract_pdf_text(file_path: str) -> str:
         """Extract text from PDF file"""
@@ -125,5 +189,40 @@ class DocumentProcessor:
         """Validate file size (default 10MB)"""
         return file_size <= max_size
 
+    @staticmethod
+    async def save_upload_file(upload_file, file_path: str, max_size: int) -> Tuple[int, str]:
+        """
+        Stream an uploaded file to disk without buffering it in memory,
+        hashing the content on the way through
+        Returns: (bytes_written, sha256_hexdigest)
+        Raises FileTooLargeError (after removing the partial file) if the
+        upload exceeds max_size
+        """
+        size = 0
+        hasher = hashlib.sha256()
+        try:
+            async with aiofiles.open(file_path, 'wb') as out:
+                while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > max_size:
+                        raise FileTooLargeError(f"Upload exceeds {max_size} bytes")
+                    hasher.update(chunk)
+                    await out.write(chunk)
+        except BaseException:
+            # Don't leave partial files behind (also covers client disconnects)
+            await DocumentProcessor.remove_file(file_path)
+            raise
+        return size, hasher.hexdigest()
+
+    @staticmethod
+    async def remove_file(file_path: str) -> None:
+        """Remove a stored file without blocking the event loop; missing files are ignored"""
+        try:
+            await aiofiles.os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete file {file_path}: {e}")
+
 # Global instance
 document_processor = DocumentProcessor()
\ No newline at end of file
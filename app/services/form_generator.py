@@ -4,7 +4,6 @@ import logging
 from datetime import datetime
 from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 
 from app.models.compliance import ComplianceRequirement, AssessmentSession, ComplianceAssessment
@@ -25,23 +24,20 @@ class FormGenerator:
     async def generate_questionnaire(
         self,
         db: AsyncSession,
-        jurisdiction_id: int,
+        jurisdiction: Jurisdiction,
         use_assistant_api: bool = True
     ) -> Dict[str, Any]:
-        """Generate a dynamic questionnaire based on jurisdiction requirements and uploaded compliance data"""
+        """
+        Generate a dynamic questionnaire based on jurisdiction requirements and uploaded compliance data
+        The jurisdiction is the one the caller already loaded for its access check
+        """
         try:
-            # Get jurisdiction with compliance requirements
+            # Get the jurisdiction's compliance requirements
             result = await db.execute(
-                select(Jurisdiction)
-                .options(selectinload(Jurisdiction.requirements))
-                .where(Jurisdiction.id == jurisdiction_id)
+                select(ComplianceRequirement)
+                .where(ComplianceRequirement.jurisdiction_id == jurisdiction.id)
             )
-            jurisdiction = result.scalar_one_or_none()
-
-            if not jurisdiction:
-                raise ValueError(f"Jurisdiction {jurisdiction_id} not found")
-
-            compliance_requirements = jurisdiction.requirements
+            compliance_requirements = result.scalars().all()
 
             # Use ComplianceRequirement table for fast, cost-effective questionnaire generation
             # This table contains requirements extracted from admin documents
@@ -1,7 +1,9 @@
 """OpenAI service for AI compliance analysis with improved chunking"""
 
 import openai
+import asyncio
 from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
 from app.config import settings
 import json
 import logging
@@ -9,6 +11,15 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Chunks of one document analyzed concurrently; keeps large documents
+# within the account's rate limits
+MAX_CONCURRENT_CHUNK_CALLS = 4
+
+# Rules rendered into one prompt, and the description length kept per rule,
+# so jurisdictions with many extracted requirements fit the context window
+MAX_PROMPT_RULES = 20
+MAX_RULE_DESCRIPTION_CHARS = 300
+
 class OpenAIService:
     def __init__(self):
         if settings.OPENAI_API_KEY:
@@ -63,46 +74,51 @@ class OpenAIService:
         chunks = self._create_intelligent_chunks_for_user_docs(document_content)
         logger.info(f"Created {len(chunks)} chunks for analysis")
 
-        all_findings = []
-        chunk_scores = []
+        # The same rules go with every chunk, so render them once
+        rules_text = self._format_rules(jurisdiction_rules)
 
-        # Analyze each chunk
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Analyzing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
+        # Analyze the chunks concurrently; results come back in chunk order
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNK_CALLS)
 
+        async def analyze_chunk(i: int, chunk: str) -> Optional[Dict[str, Any]]:
             prompt = self._build_chunk_compliance_prompt(
                 chunk,
-                jurisdiction_rules,
+                rules_text,
                 document_type,
                 i + 1,
                 len(chunks)
             )
+            async with semaphore:
+                logger.info(f"Analyzing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
+                try:
+                    response = await self.client.chat.completions.create(
+                        model=settings.OPENAI_MODEL,
+                        messages=[
+                            {
+                                "role": "system",
+                                "content": "You are an AI compliance expert specializing in AI regulations like EU AI Act, US AI Governance, and ISO/IEC 42001. Analyze document sections for compliance."
+                            },
+                            {"role": "user", "content": prompt}
+                        ],
+                        temperature=0.1,
+                        max_tokens=3000  # More tokens for detailed analysis
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to analyze chunk {i+1}: {e}")
+                    return None
+            return self._parse_analysis_result(response.choices[0].message.content)
+
+        chunk_analyses = await asyncio.gather(
+            *(analyze_chunk(i, chunk) for i, chunk in enumerate(chunks))
+        )
 
-            try:
-                response = await self.client.chat.completions.create(
-                    model=settings.OPENAI_MODEL,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an AI compliance expert specializing in AI regulations like EU AI Act, US AI Governance, and ISO/IEC 42001. Analyze document sections for compliance."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.1,
-                    max_tokens=3000  # More tokens for detailed analysis
-                )
-
-                result = response.choices[0].message.content
-                chunk_analysis = self._parse_analysis_result(result)
-
-                if chunk_analysis and "compliance_rules" in chunk_analysis:
-                    all_findings.extend(chunk_analysis.get("compliance_rules", []))
-                    if "overall_score" in chunk_analysis:
-                        chunk_scores.append(chunk_analysis["overall_score"])
-
-            except Exception as e:
-                logger.error(f"Failed to analyze chunk {i+1}: {e}")
-                continue
+        all_findings = []
+        chunk_scores = []
+        for chunk_analysis in chunk_analyses:
+            if chunk_analysis and "compliance_rules" in chunk_analysis:
+                all_findings.extend(chunk_analysis.get("compliance_rules", []))
+                if "overall_score" in chunk_analysis:
+                    chunk_scores.append(chunk_analysis["overall_score"])
 
         # Merge and deduplicate findings
         return self._merge_compliance_findings(all_findings, chunk_scores)
@@ -117,7 +133,7 @@ class OpenAIService:
 
         prompt = self._build_compliance_prompt(
             document_content,
-            jurisdiction_rules,
+            self._format_rules(jurisdiction_rules),
             document_type
         )
 
@@ -341,18 +357,35 @@ class OpenAIService:
 
         return final_chunks if final_chunks else [text[:max_chars]]
 
+    def _format_rules(self, jurisdiction_rules: List[Any]) -> str:
+        """
+        Render compliance rules as prompt lines. ComplianceRequirement rows
+        are rendered by id, title and description rather than their repr.
+        At most MAX_PROMPT_RULES rules are included, with descriptions cut
+        to MAX_RULE_DESCRIPTION_CHARS, to avoid token overflow.
+        """
+
+        lines = []
+        for rule in jurisdiction_rules[:MAX_PROMPT_RULES]:
+            if hasattr(rule, "requirement_id"):
+                description = rule.description or ""
+                if len(description) > MAX_RULE_DESCRIPTION_CHARS:
+                    description = description[:MAX_RULE_DESCRIPTION_CHARS].rstrip() + "..."
+                lines.append(f"- [{rule.requirement_id}] {rule.title}: {description}")
+            else:
+                lines.append(f"- {rule}")
+        return "\n".join(lines)
+
     def _build_chunk_compliance_prompt(
         self,
         chunk_content: str,
-        jurisdiction_rules: List[str],
+        rules_text: str,
         document_type: str,
         chunk_num: int,
         total_chunks: int
     ) -> str:
         """Build compliance analysis prompt for a chunk"""
 
-        rules_text = "\n".join([f"- {rule}" for rule in jurisdiction_rules[:20]])  # Limit rules to avoid token overflow
-
         return f"""
 Analyze this section (part {chunk_num} of {total_chunks}) of a {document_type} document against compliance requirements:
 
@@ -386,13 +419,11 @@ Focus on specific quotes and actionable insights.
     def _build_compliance_prompt(
         self,
         document_content: str,
-        jurisdiction_rules: List[str],
+        rules_text: str,
         document_type: str
     ) -> str:
         """Build the analysis prompt for GPT (single analysis)"""
 
-        rules_text = "\n".join([f"- {rule}" for rule in jurisdiction_rules])
-
         return f"""
 Analyze this {document_type} document against the following compliance requirements:
 
@@ -457,11 +488,7 @@ Focus on specific, actionable insights and cite exact text from the document whe
         final_findings = list(unique_findings.values())
 
         # Count statuses
-        status_counts = {"conform": 0, "partial": 0, "non_conform": 0}
-        for finding in final_findings:
-            status = finding.get("status", "non_conform").replace("non_conform", "non_conform")
-            if status in status_counts:
-                status_counts[status] += 1
+        status_counts = Counter(finding.get("status", "non_conform") for finding in final_findings)
 
         # Calculate overall score
         if chunk_scores:
@@ -558,7 +585,7 @@ Focus on specific, actionable insights and cite exact text from the document whe
 Analyze these AI governance questionnaire responses against compliance requirements:
 
 COMPLIANCE RULES:
-{chr(10).join([f"- {rule}" for rule in jurisdiction_rules])}
+{self._format_rules(jurisdiction_rules)}
 
 QUESTIONNAIRE RESPONSES:
 {responses_text}
@@ -597,15 +624,70 @@ Provide the same JSON structure as document analysis, focusing on gaps identifie
 
     async def extract_compliance_requirements(
         self,
-        prompt: str,
+        document_name: str,
         document_content: str
     ) -> List[Dict[str, Any]]:
-        """Extract compliance requirements from admin documents for ComplianceRequirement table"""
+        """
+        Extract compliance requirements from admin documents for ComplianceRequirement table
+        The whole document is covered, one chunk per call; a requirement_id
+        found in several chunks is kept from the first
+        """
 
         if not self.client:
             logger.warning("OpenAI client not available, returning empty requirements")
             return []
 
+        chunks = self._create_intelligent_chunks_for_user_docs(document_content)
+        logger.info(f"Extracting requirements from {document_name} in {len(chunks)} chunks")
+
+        requirements = []
+        seen_requirement_ids = set()
+        for i, chunk in enumerate(chunks):
+            prompt = self._build_requirements_prompt(document_name, chunk, i + 1, len(chunks))
+            for requirement in await self._extract_requirements_from_chunk(prompt):
+                requirement_id = requirement.get("requirement_id")
+                if requirement_id in seen_requirement_ids:
+                    continue
+                seen_requirement_ids.add(requirement_id)
+                requirements.append(requirement)
+
+        logger.info(f"Extracted {len(requirements)} compliance requirements")
+        return requirements
+
+    def _build_requirements_prompt(
+        self,
+        document_name: str,
+        chunk: str,
+        chunk_num: int,
+        total_chunks: int
+    ) -> str:
+        """Build the requirements extraction prompt for one chunk of a document"""
+
+        return f"""
+        Extract compliance requirements from this document: {document_name} (section {chunk_num} of {total_chunks})
+
+        Document content:
+        {chunk}
+
+        Please extract specific, actionable compliance requirements and return them as a JSON array with this structure:
+        [
+            {{
+                "requirement_id": "unique_id",
+                "title": "Requirement title",
+                "description": "Detailed requirement description",
+                "category": "Category (e.g., Risk Management, Data Protection, etc.)",
+                "criticality": "high|medium|low",
+                "regulation_type": "eu_ai_act|us_ai_governance|iso_42001"
+            }}
+        ]
+
+        Focus on extracting concrete, measurable requirements that organizations need to implement.
+        Categorize by regulation type based on document content.
+        """
+
+    async def _extract_requirements_from_chunk(self, prompt: str) -> List[Dict[str, Any]]:
+        """Run one requirements extraction call and parse its JSON array"""
+
         try:
             response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -632,9 +714,7 @@ Provide the same JSON structure as document analysis, focusing on gaps identifie
                 end_idx = result.rfind(']')
                 if start_idx != -1 and end_idx != -1:
                     json_str = result[start_idx:end_idx + 1]
-                    requirements = json.loads(json_str)
-                    logger.info(f"Extracted {len(requirements)} compliance requirements")
-                    return requirements
+                    return json.loads(json_str)
                 else:
                     logger.error("No valid JSON array found in OpenAI response")
                     return []
@@ -0,0 +1,86 @@
+"""Short-lived per-organization snapshots of serialized API responses"""
+
+import asyncio
+import hashlib
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+import orjson
+
+# Dashboard data changes on a minute scale at most; document listings only
+# change on upload, delete or analysis. Writes that affect either also
+# invalidate the snapshot straight away.
+DASHBOARD_CACHE_TTL = 30  # seconds
+DOCUMENTS_CACHE_TTL = 300  # seconds
+
+
+class SnapshotCache:
+    """
+    Serialized response payloads and their ETags, per organization.
+
+    Rebuilds read generation() before querying and pass it to set(); an
+    invalidate() in between means the rebuild may have read data from
+    before the write, so its payload is returned but not stored.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._snapshots: Dict[UUID, Tuple[float, bytes, str, Dict[str, str]]] = {}
+        self._generations: Dict[UUID, int] = {}
+        # Locks only live while a rebuild holds or waits on them
+        self._locks: "weakref.WeakValueDictionary[UUID, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def get(self, organization_id: UUID) -> Optional[Tuple[bytes, str, Dict[str, str]]]:
+        """Return (body, etag, headers) if the organization has a fresh snapshot"""
+        snapshot = self._snapshots.get(organization_id)
+        if snapshot and time.monotonic() - snapshot[0] < self.ttl:
+            return snapshot[1:]
+        return None
+
+    def generation(self, organization_id: UUID) -> int:
+        """Invalidation count of the organization, read before a rebuild"""
+        return self._generations.get(organization_id, 0)
+
+    def set(
+        self,
+        organization_id: UUID,
+        payload: Any,
+        generation: int,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[bytes, str, Dict[str, str]]:
+        """
+        Serialize a payload and return (body, etag, headers), headers being
+        any extra response headers to serve with it; it is stored only if
+        the organization wasn't invalidated since generation was read
+        """
+        headers = headers or {}
+        body = orjson.dumps(payload)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if self.generation(organization_id) == generation:
+            now = time.monotonic()
+            # Drop other organizations' expired snapshots while we're here
+            expired = [org_id for org_id, snapshot in self._snapshots.items() if now - snapshot[0] >= self.ttl]
+            for org_id in expired:
+                del self._snapshots[org_id]
+            self._snapshots[organization_id] = (now, body, etag, headers)
+        return body, etag, headers
+
+    def lock(self, organization_id: UUID) -> asyncio.Lock:
+        """Lock held while rebuilding, so concurrent misses only build once"""
+        lock = self._locks.get(organization_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[organization_id] = lock
+        return lock
+
+    def invalidate(self, organization_id: UUID) -> None:
+        """Drop the organization's snapshot after a write that changes it"""
+        self._generations[organization_id] = self.generation(organization_id) + 1
+        self._snapshots.pop(organization_id, None)
+
+
+# Global instances
+dashboard_cache = SnapshotCache(DASHBOARD_CACHE_TTL)
+documents_cache = SnapshotCache(DOCUMENTS_CACHE_TTL)
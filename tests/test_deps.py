@@ -0,0 +1,97 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.dialects import postgresql
+
+from app.api import deps
+from app.models.organization import UserRole
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class FakeSession:
+    """Records the statement instead of running it"""
+
+    def __init__(self, row):
+        self.row = row
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.row)
+
+
+@pytest.fixture
+def user_id(monkeypatch):
+    user_id = uuid.uuid4()
+    monkeypatch.setattr(
+        deps, "decode_token", lambda token: {"sub": str(user_id), "type": "access"}
+    )
+    return user_id
+
+
+def credentials():
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+
+def compiled_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_auth_query_picks_first_joined_membership(user_id):
+    user = SimpleNamespace(id=user_id, is_active=True)
+    organization = SimpleNamespace(id=uuid.uuid4())
+    db = FakeSession((user, organization, UserRole.ADMIN))
+
+    context = await deps.get_auth_context(credentials(), db)
+
+    assert context.user is user
+    assert context.organization is organization
+    assert context.role == UserRole.ADMIN
+
+    # Users in several organizations resolve to the same membership on
+    # every request: earliest joined, ties broken by organization id
+    sql = compiled_sql(db.statements[0])
+    assert "ORDER BY user_organizations.joined_at, user_organizations.organization_id" in sql
+    assert "LIMIT" in sql
+
+
+@pytest.mark.asyncio
+async def test_user_without_membership_has_no_organization(user_id):
+    user = SimpleNamespace(id=user_id, is_active=True)
+    db = FakeSession((user, None, None))
+
+    context = await deps.get_auth_context(credentials(), db)
+
+    assert context.organization is None
+    assert context.role is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_is_rejected(user_id):
+    db = FakeSession(None)
+
+    with pytest.raises(deps.HTTPException) as exc_info:
+        await deps.get_auth_context(credentials(), db)
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_inactive_user_is_rejected(user_id):
+    user = SimpleNamespace(id=user_id, is_active=False)
+    db = FakeSession((user, None, None))
+
+    with pytest.raises(deps.HTTPException) as exc_info:
+        await deps.get_auth_context(credentials(), db)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,82 @@
+import hashlib
+import io
+
+import pytest
+
+from app.services.document_processor import DocumentProcessor, FileTooLargeError
+
+
+class FakeUpload:
+    """Minimal stand-in for UploadFile: async chunked reads over bytes"""
+
+    def __init__(self, content: bytes):
+        self._buffer = io.BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+class DisconnectingUpload(FakeUpload):
+    """Upload whose client goes away after the first chunk"""
+
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self._reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self._reads += 1
+        if self._reads > 1:
+            raise ConnectionResetError("client disconnected")
+        return await super().read(size)
+
+
+@pytest.mark.asyncio
+async def test_save_upload_file_returns_size_and_sha256(tmp_path):
+    content = b"compliance policy\n" * 100_000  # spans several chunks
+    file_path = tmp_path / "upload.txt"
+
+    size, content_hash = await DocumentProcessor.save_upload_file(
+        FakeUpload(content), str(file_path), max_size=len(content)
+    )
+
+    assert size == len(content)
+    assert content_hash == hashlib.sha256(content).hexdigest()
+    assert file_path.read_bytes() == content
+
+
+@pytest.mark.asyncio
+async def test_save_upload_file_rejects_oversized_upload_and_removes_partial_file(tmp_path):
+    content = b"x" * (3 * 1024 * 1024)
+    file_path = tmp_path / "upload.pdf"
+
+    with pytest.raises(FileTooLargeError):
+        await DocumentProcessor.save_upload_file(
+            FakeUpload(content), str(file_path), max_size=len(content) - 1
+        )
+
+    assert not file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_save_upload_file_removes_partial_file_on_disconnect(tmp_path):
+    content = b"x" * (3 * 1024 * 1024)
+    file_path = tmp_path / "upload.pdf"
+
+    with pytest.raises(ConnectionResetError):
+        await DocumentProcessor.save_upload_file(
+            DisconnectingUpload(content), str(file_path), max_size=len(content)
+        )
+
+    assert not file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_save_upload_file_accepts_upload_at_exact_limit(tmp_path):
+    content = b"y" * 1024
+    file_path = tmp_path / "upload.txt"
+
+    size, _ = await DocumentProcessor.save_upload_file(
+        FakeUpload(content), str(file_path), max_size=1024
+    )
+
+    assert size == 1024
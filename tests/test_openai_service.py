@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.openai_service import (
+    OpenAIService,
+    MAX_PROMPT_RULES,
+    MAX_RULE_DESCRIPTION_CHARS,
+)
+
+
+@pytest.fixture
+def service():
+    return OpenAIService()
+
+
+def requirement(requirement_id: str, title: str = "Title", description: str = "Description"):
+    return SimpleNamespace(requirement_id=requirement_id, title=title, description=description)
+
+
+def test_requirements_render_as_id_title_and_description(service):
+    text = service._format_rules([
+        requirement("Article_5.1", "Prohibited practices", "No manipulative AI."),
+        requirement("ISO_4.1", "Context", "Understand the organization."),
+    ])
+
+    assert text.splitlines() == [
+        "- [Article_5.1] Prohibited practices: No manipulative AI.",
+        "- [ISO_4.1] Context: Understand the organization.",
+    ]
+
+
+def test_plain_string_rules_render_as_is(service):
+    assert service._format_rules(["Keep logs", "Human oversight"]) == "- Keep logs\n- Human oversight"
+
+
+def test_rule_count_is_capped(service):
+    rules = [requirement(f"R{i}") for i in range(MAX_PROMPT_RULES + 5)]
+
+    lines = service._format_rules(rules).splitlines()
+
+    assert len(lines) == MAX_PROMPT_RULES
+    assert lines[-1].startswith(f"- [R{MAX_PROMPT_RULES - 1}]")
+
+
+def test_long_descriptions_are_truncated(service):
+    long_description = "word " * MAX_RULE_DESCRIPTION_CHARS
+
+    line = service._format_rules([requirement("R1", "Title", long_description)])
+
+    description = line.split(": ", 1)[1]
+    assert description.endswith("...")
+    assert len(description) <= MAX_RULE_DESCRIPTION_CHARS + len("...")
+
+
+def test_missing_description_renders_empty(service):
+    assert service._format_rules([requirement("R1", "Title", None)]) == "- [R1] Title: "
+
+
+def test_no_rules_render_empty(service):
+    assert service._format_rules([]) == ""
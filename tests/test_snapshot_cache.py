@@ -0,0 +1,128 @@
+import asyncio
+import gc
+import uuid
+
+import orjson
+import pytest
+
+from app.services import snapshot_cache
+from app.services.snapshot_cache import SnapshotCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(snapshot_cache.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def org_id():
+    return uuid.uuid4()
+
+
+def test_get_is_empty_until_set(org_id):
+    cache = SnapshotCache(ttl=30)
+
+    assert cache.get(org_id) is None
+
+
+def test_set_serializes_and_serves_until_ttl(clock, org_id):
+    cache = SnapshotCache(ttl=30)
+    payload = {"documents": [1, 2, 3]}
+
+    body, etag, headers = cache.set(org_id, payload, cache.generation(org_id))
+
+    assert orjson.loads(body) == payload
+    assert headers == {}
+    assert cache.get(org_id) == (body, etag, {})
+
+    clock.now += 29.9
+    assert cache.get(org_id) == (body, etag, {})
+
+    clock.now += 0.1
+    assert cache.get(org_id) is None
+
+
+def test_etag_is_quoted_and_tracks_content(org_id):
+    cache = SnapshotCache(ttl=30)
+
+    _, etag_a, _ = cache.set(org_id, {"score": 1}, cache.generation(org_id))
+    _, etag_same, _ = cache.set(org_id, {"score": 1}, cache.generation(org_id))
+    _, etag_b, _ = cache.set(org_id, {"score": 2}, cache.generation(org_id))
+
+    assert etag_a.startswith('"') and etag_a.endswith('"')
+    assert etag_a == etag_same
+    assert etag_a != etag_b
+
+
+def test_headers_are_stored_with_snapshot(org_id):
+    cache = SnapshotCache(ttl=30)
+
+    cache.set(org_id, [], cache.generation(org_id), headers={"X-Next-Cursor": "abc"})
+
+    assert cache.get(org_id)[2] == {"X-Next-Cursor": "abc"}
+
+
+def test_invalidate_drops_only_that_organization(org_id):
+    cache = SnapshotCache(ttl=30)
+    other_org_id = uuid.uuid4()
+    cache.set(org_id, {"a": 1}, cache.generation(org_id))
+    cache.set(other_org_id, {"b": 2}, cache.generation(other_org_id))
+
+    cache.invalidate(org_id)
+
+    assert cache.get(org_id) is None
+    assert cache.get(other_org_id) is not None
+
+
+def test_rebuild_spanning_invalidate_is_returned_but_not_stored(org_id):
+    cache = SnapshotCache(ttl=30)
+
+    # A rebuild reads the generation, then a write invalidates before it sets
+    generation = cache.generation(org_id)
+    cache.invalidate(org_id)
+    body, etag, _ = cache.set(org_id, {"stale": True}, generation)
+
+    assert orjson.loads(body) == {"stale": True}
+    assert cache.get(org_id) is None
+
+    # The next rebuild, started after the write, is stored
+    cache.set(org_id, {"stale": False}, cache.generation(org_id))
+    assert orjson.loads(cache.get(org_id)[0]) == {"stale": False}
+
+
+def test_set_prunes_other_expired_snapshots(clock, org_id):
+    cache = SnapshotCache(ttl=30)
+    old_org_id = uuid.uuid4()
+    cache.set(old_org_id, {}, cache.generation(old_org_id))
+
+    clock.now += 31
+    cache.set(org_id, {}, cache.generation(org_id))
+
+    assert old_org_id not in cache._snapshots
+    assert org_id in cache._snapshots
+
+
+def test_lock_is_shared_while_held_and_released_after():
+    cache = SnapshotCache(ttl=30)
+    org_id = uuid.uuid4()
+
+    async def run():
+        lock = cache.lock(org_id)
+        async with lock:
+            assert cache.lock(org_id) is lock
+        del lock
+
+    asyncio.run(run())
+    gc.collect()
+
+    assert org_id not in cache._locks